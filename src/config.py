@@ -8,13 +8,19 @@ settings for securely loading API keys from environment variables.
 
 import os
 from enum import Enum
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, Mapping, Optional
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic_settings import BaseSettings, EnvSettingsSource
+from functools import cached_property, lru_cache
 
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
 
-# Load environment variables from .env file if it exists
+
+# Load environment variables from .env file if it exists. This only reads one
+# small file, and must happen before the module-level settings below read
+# os.environ.
 load_dotenv()
 
 
@@ -37,14 +43,14 @@ PYUSD_ADDRESSES = {
 }
 
 # Advanced RPC Methods Available on GCP
-GCP_ADVANCED_METHODS = {
+GCP_ADVANCED_METHODS = frozenset({
     'debug_traceTransaction',
     'debug_traceCall',
     'trace_block',
     'trace_transaction',
     'trace_call',
     'eth_getProof'
-}
+})
 
 
 # Default gas settings
@@ -104,25 +110,49 @@ def get_api_key(key_name: str) -> Optional[str]:
     return value
 
 
-def get_network_config(network: Network) -> Dict[str, Any]:
+@lru_cache(maxsize=8)
+def get_network_config(network: Network) -> Mapping[str, Any]:
     """
     Get the configuration for a specific network.
     
+    The result is cached per network, so it is returned as a read-only view.
+    
     Args:
         network: The network to get configuration for
         
     Returns:
-        Dictionary containing network configuration
+        Read-only mapping containing network configuration
     """
-    return {
+    return MappingProxyType({
         "rpc_url": BLOCKCHAIN_RPC_ENDPOINTS[network],
         "chain_id": NETWORK_CONFIG[network]["chain_id"],
-        "gas_settings": GAS_SETTINGS[network],
+        "gas_settings": MappingProxyType(GAS_SETTINGS[network]),
         "pyusd_contract": PYUSD_CONTRACTS[network],
         "is_testnet": NETWORK_CONFIG[network]["is_testnet"],
         "explorer_url": NETWORK_CONFIG[network]["explorer_url"],
         "block_time": NETWORK_CONFIG[network]["block_time"],
-    }
+    })
+
+
+@lru_cache()
+def get_async_web3(network: Network) -> "AsyncWeb3":
+    """
+    Get the shared async web3 client for a network.
+    
+    One provider is created per network and process so that all callers
+    share the same connection pool instead of opening their own.
+    
+    Args:
+        network: The network to connect to
+        
+    Returns:
+        AsyncWeb3 instance for the network
+    """
+    # Imported here so that reading settings does not import web3 and aiohttp
+    from web3 import AsyncWeb3
+    from pylot.rpc_session import OrjsonAsyncHTTPProvider
+    
+    return AsyncWeb3(OrjsonAsyncHTTPProvider(BLOCKCHAIN_RPC_ENDPOINTS[network]))
 
 
 # Default network to use
@@ -135,69 +165,155 @@ DEFAULT_SLIPPAGE_TOLERANCE = 0.005  # 0.5%
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
 
+class BlockchainSettings(BaseSettings):
+    """Blockchain RPC, explorer and contract address settings"""
+    # Blockchain
+    MAINNET_RPC_URL: str = ""
+    SEPOLIA_RPC_URL: str = ""
+    SEPOLIA_WSS_URL: str = ""
+    USE_TESTNET: bool = True
+    PRIVATE_KEY: str = ""
+    ETHERSCAN_API_KEY: str = ""
+    ARBISCAN_API_KEY: str = ""
+    OPTIMISM_API_KEY: str = ""
+    TESTNET_CHAIN_ID: str = ""
+    REPORT_GAS: str = ""
+    
+    # Contract Addresses
+    PYUSD_ADDRESS: str = ""
+    UNISWAP_V2_ROUTER: str = ""
+    UNISWAP_V3_ROUTER: str = ""
+    ONEINCH_ROUTER: str = ""
+    CURVE_POOL: str = ""
+    LAYERZERO_ENDPOINT: str = ""
+    HOP_BRIDGE: str = ""
+    STARGATE_ROUTER: str = ""
+    
+    class Config:
+        case_sensitive = True
+        env_file = ".env"
+        # .env holds the variables of every settings group
+        extra = "ignore"
+
+
+class GCPSettings(BaseSettings):
+    """Google Cloud project, storage and dashboard settings"""
+    GOOGLE_CLOUD_PROJECT: str = "pyusd-intent-system"
+    GOOGLE_CLOUD_REGION: str = "us-central1"
+    BIGQUERY_DATASET: str = "pyusd_intent_system"
+    GCS_BUCKET: str = "pyusd-intent-system-analytics"
+    GOOGLE_APPLICATION_CREDENTIALS: str = ""
+    GOOGLE_SHEETS_DASHBOARD_ID: str = ""
+    GOOGLE_SHEETS_TAB_NAME: str = ""
+    
+    class Config:
+        case_sensitive = True
+        env_file = ".env"
+        # .env holds the variables of every settings group
+        extra = "ignore"
+
+
+class SecuritySettings(BaseSettings):
+    """Secret, host/origin and rate limiting settings"""
+    # Security
+    SECRET_KEY: str = "your-secret-key-here"
+    ALLOWED_HOSTS: list = ["*"]
+    CORS_ORIGINS: list = ["*"]
+    
+    # Rate Limiting
+    RATE_LIMIT_PER_SECOND: int = 10
+    
+    class Config:
+        case_sensitive = True
+        env_file = ".env"
+        # .env holds the variables of every settings group
+        extra = "ignore"
+
+
 class Settings(BaseSettings):
+    """
+    Application settings.
+    
+    Environment variables are read when the settings object is created rather
+    than when the class is defined. The blockchain, GCP and security groups are only parsed
+    the first time they are accessed.
+    """
     # Environment
-    ENV: str = os.getenv("ENV", "development")
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    ENV: str = "development"
+    DEBUG: bool = False
     
     # Application
     PROJECT_NAME: str = "PYUSD Intent System"
     VERSION: str = "1.0.0"
     API_PREFIX: str = "/api/v1"
     
-    # Google Cloud
-    GOOGLE_CLOUD_PROJECT: str = os.getenv("GOOGLE_CLOUD_PROJECT", "pyusd-intent-system")
-    GOOGLE_CLOUD_REGION: str = os.getenv("GOOGLE_CLOUD_REGION", "us-central1")
-    BIGQUERY_DATASET: str = os.getenv("BIGQUERY_DATASET", "pyusd_intent_system")
-    GCS_BUCKET: str = os.getenv("GCS_BUCKET", "pyusd-intent-system-analytics")
-    GOOGLE_APPLICATION_CREDENTIALS: str = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
-    GOOGLE_SHEETS_DASHBOARD_ID: str = os.getenv("GOOGLE_SHEETS_DASHBOARD_ID", "")
-    GOOGLE_SHEETS_TAB_NAME: str = os.getenv("GOOGLE_SHEETS_TAB_NAME", "")
+    # Monitoring
+    ENABLE_METRICS: bool = True
     
-    # Blockchain
-    MAINNET_RPC_URL: str = os.getenv("MAINNET_RPC_URL", "")
-    SEPOLIA_RPC_URL: str = os.getenv("SEPOLIA_RPC_URL", "")
-    SEPOLIA_WSS_URL: str = os.getenv("SEPOLIA_WSS_URL", "")
-    USE_TESTNET: bool = os.getenv("USE_TESTNET", "True").lower() == "true"
-    PRIVATE_KEY: str = os.getenv("PRIVATE_KEY", "")
-    ETHERSCAN_API_KEY: str = os.getenv("ETHERSCAN_API_KEY", "")
-    ARBISCAN_API_KEY: str = os.getenv("ARBISCAN_API_KEY", "")
-    OPTIMISM_API_KEY: str = os.getenv("OPTIMISM_API_KEY", "")
-    TESTNET_CHAIN_ID: str = os.getenv("TESTNET_CHAIN_ID", "")
-    REPORT_GAS: str = os.getenv("REPORT_GAS", "")
+    @cached_property
+    def blockchain(self) -> BlockchainSettings:
+        return BlockchainSettings()
     
-    # Contract Addresses
-    PYUSD_ADDRESS: str = os.getenv("PYUSD_ADDRESS", "")
-    UNISWAP_V2_ROUTER: str = os.getenv("UNISWAP_V2_ROUTER", "")
-    UNISWAP_V3_ROUTER: str = os.getenv("UNISWAP_V3_ROUTER", "")
-    ONEINCH_ROUTER: str = os.getenv("ONEINCH_ROUTER", "")
-    CURVE_POOL: str = os.getenv("CURVE_POOL", "")
-    LAYERZERO_ENDPOINT: str = os.getenv("LAYERZERO_ENDPOINT", "")
-    HOP_BRIDGE: str = os.getenv("HOP_BRIDGE", "")
-    STARGATE_ROUTER: str = os.getenv("STARGATE_ROUTER", "")
+    @cached_property
+    def gcp(self) -> GCPSettings:
+        return GCPSettings()
     
-    # Security
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
-    ALLOWED_HOSTS: list = os.getenv("ALLOWED_HOSTS", "*").split(",")
-    CORS_ORIGINS: list = os.getenv("CORS_ORIGINS", "*").split(",")
-    
-    # Rate Limiting
-    RATE_LIMIT_PER_SECOND: int = int(os.getenv("RATE_LIMIT_PER_SECOND", "10"))
-    
-    # Monitoring
-    ENABLE_METRICS: bool = os.getenv("ENABLE_METRICS", "True").lower() == "true"
+    @cached_property
+    def security(self) -> SecuritySettings:
+        return SecuritySettings()
     
     class Config:
         case_sensitive = True
         env_file = ".env"
+        # .env holds the variables of every settings group
+        extra = "ignore"
 
 @lru_cache()
 def get_settings() -> Settings:
     return Settings()
 
 # Production specific settings
-class ProductionSettings(Settings):
-    DEBUG: bool = False
+class _ProductionSources:
+    """
+    Settings mixin that reads PROD_-prefixed variables first and falls back
+    to the unprefixed ones, so production only needs to set what differs.
+    Subclasses set env_prefix = "PROD_" in their own Config.
+    """
+    # Fields that are never taken from the unprefixed variables
+    PRODUCTION_ONLY: ClassVar[FrozenSet[str]] = frozenset()
+    
+    @classmethod
+    def settings_customise_sources(cls, settings_cls, init_settings, env_settings,
+                                   dotenv_settings, file_secret_settings):
+        # .env is already in os.environ, so the unprefixed source covers it too
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            _UnprefixedEnvSource(settings_cls, settings_cls.PRODUCTION_ONLY),
+            file_secret_settings,
+        )
+
+class _UnprefixedEnvSource(EnvSettingsSource):
+    """Unprefixed environment variables, minus the excluded fields"""
+    
+    def __init__(self, settings_cls, exclude: FrozenSet[str]):
+        super().__init__(settings_cls, env_prefix="")
+        self.exclude = exclude
+    
+    def __call__(self) -> Dict[str, Any]:
+        return {k: v for k, v in super().__call__().items() if k not in self.exclude}
+
+class ProductionBlockchainSettings(_ProductionSources, BlockchainSettings):
+    class Config:
+        env_prefix = "PROD_"
+
+class ProductionGCPSettings(_ProductionSources, GCPSettings):
+    class Config:
+        env_prefix = "PROD_"
+
+class ProductionSecuritySettings(_ProductionSources, SecuritySettings):
+    PRODUCTION_ONLY: ClassVar[FrozenSet[str]] = frozenset({"ALLOWED_HOSTS", "CORS_ORIGINS"})
     ALLOWED_HOSTS: list = ["api.pyusd-intent-system.cloud.goog"]
     CORS_ORIGINS: list = [
         "https://pyusd-intent-system.cloud.goog",
@@ -207,12 +323,26 @@ class ProductionSettings(Settings):
     class Config:
         env_prefix = "PROD_"
 
+class ProductionSettings(_ProductionSources, Settings):
+    DEBUG: bool = False
+    
+    @cached_property
+    def blockchain(self) -> BlockchainSettings:
+        return ProductionBlockchainSettings()
+    
+    @cached_property
+    def gcp(self) -> GCPSettings:
+        return ProductionGCPSettings()
+    
+    @cached_property
+    def security(self) -> SecuritySettings:
+        return ProductionSecuritySettings()
+    
+    class Config:
+        env_prefix = "PROD_"
+
 @lru_cache()
 def get_production_settings() -> Optional[ProductionSettings]:
     if os.getenv("ENV") == "production":
         return ProductionSettings()
     return None
-
-settings = get_settings()
-prod_settings = get_production_settings()
-
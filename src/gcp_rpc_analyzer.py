@@ -5,15 +5,78 @@ This module leverages GCP's advanced RPC methods for deep transaction analysis
 and optimization of PYUSD transactions.
 """
 
-from web3 import Web3
-from typing import Dict, List, Optional
+from functools import lru_cache
+from web3 import AsyncWeb3
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
+import numpy as np
+import orjson
+import pandas as pd
 from eth_typing import HexStr
-from config import BLOCKCHAIN_RPC_ENDPOINTS, Network, GCP_ADVANCED_METHODS
+from config import (
+    BLOCKCHAIN_RPC_ENDPOINTS,
+    Network,
+    GCP_ADVANCED_METHODS,
+    PYUSD_ADDRESSES,
+    get_async_web3,
+)
+from pylot.rpc_session import get_session
+
+# Maximum number of calls packed into a single JSON-RPC batch request
+MAX_RPC_BATCH_SIZE = 64
+
+# Maximum number of batch requests in flight at once, tune to the provider's rate limits
+MAX_CONCURRENT_BATCHES = 16
+
+# Raw 20-byte PYUSD contract addresses across all networks, skipping unset placeholders
+_PYUSD_BYTES = frozenset(
+    bytes.fromhex(address[2:])
+    for address in PYUSD_ADDRESSES.values()
+    if address and address != "0x" + "0" * 40
+)
+
+
+# Lowercased hex form of the same addresses, for vectorized string comparison
+_PYUSD_HEX = frozenset("0x" + address.hex() for address in _PYUSD_BYTES)
+
+# Blocks with at least this many traces are filtered with pandas instead of a Python loop
+VECTORIZED_FILTER_MIN_TRACES = 500
+
+
+@lru_cache(maxsize=4096)
+def _address_bytes(address: str) -> bytes:
+    """Decode a 0x-prefixed hex address into its raw bytes"""
+    return bytes.fromhex(address[2:])
 
 class GCPRPCAnalyzer:
     def __init__(self, network: Network):
-        self.w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_ENDPOINTS[network]))
+        self.rpc_url = BLOCKCHAIN_RPC_ENDPOINTS[network]
+        self.w3: AsyncWeb3 = get_async_web3(network)
+
+    async def _batch_rpc(self, calls: List[Tuple[str, List[Any]]]) -> List[Dict]:
+        """
+        Send several RPC calls in a single JSON-RPC batch request.
+        Responses are returned in the same order as the calls.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        async with get_session().post(
+            self.rpc_url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            results = orjson.loads(await response.read())
+
+        # A failed batch comes back as a single error object
+        if not isinstance(results, list):
+            raise ValueError(f"Batch RPC request failed: {results}")
+
+        # Batch responses are not guaranteed to preserve request order
+        return sorted(results, key=lambda result: result["id"])
         
     async def trace_transaction(self, tx_hash: str) -> Dict:
         """
@@ -24,18 +87,26 @@ class GCPRPCAnalyzer:
             [tx_hash, {"tracer": "callTracer"}]
         )
 
-    async def analyze_block_transactions(self, block_number: int) -> List[Dict]:
+    async def analyze_block_transactions(self,
+                                         block_number: int,
+                                         traces: Optional[Dict] = None) -> List[Dict]:
         """
-        Analyze all PYUSD transactions in a block using trace_block
+        Analyze all PYUSD transactions in a block using trace_block.
+        A pre-fetched trace_block response can be passed to skip the RPC call.
         """
-        traces = await self.w3.provider.make_request(
-            "trace_block",
-            [hex(block_number)]
-        )
+        if traces is None:
+            traces = await self.w3.provider.make_request(
+                "trace_block",
+                [hex(block_number)]
+            )
         
         # Filter for PYUSD-related transactions
+        results = traces["result"]
+        if len(results) >= VECTORIZED_FILTER_MIN_TRACES:
+            return self._filter_pyusd_traces(results)
+        
         pyusd_traces = [
-            trace for trace in traces["result"]
+            trace for trace in results
             if self._is_pyusd_related(trace)
         ]
         
@@ -68,13 +139,23 @@ class GCPRPCAnalyzer:
             [address, storage_keys, "latest"]
         )
 
+    def _filter_pyusd_traces(self, traces: List[Dict]) -> List[Dict]:
+        """
+        Select PYUSD-related traces with a vectorized address comparison
+        """
+        df = pd.json_normalize(traces)
+        if "action.to" not in df:
+            return []
+        
+        mask = df["action.to"].str.lower().isin(_PYUSD_HEX).to_numpy()
+        return [traces[i] for i in np.flatnonzero(mask)]
+
     def _is_pyusd_related(self, trace: Dict) -> bool:
         """
         Check if a trace is related to PYUSD transactions
         """
-        # Implement PYUSD transaction detection logic
-        # This could check for PYUSD contract addresses, method signatures, etc.
-        pass
+        to = trace.get("action", {}).get("to")
+        return bool(to) and _address_bytes(to) in _PYUSD_BYTES
 
     async def analyze_mev_opportunities(self, 
                                      block_range: range) -> List[Dict]:
@@ -82,9 +163,25 @@ class GCPRPCAnalyzer:
         Analyze blocks for potential MEV opportunities involving PYUSD
         """
         mev_opportunities = []
+        blocks = list(block_range)
+        hex_blocks = list(map(hex, blocks))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+        
+        async def fetch_window(start: int) -> List[Dict]:
+            async with semaphore:
+                return await self._batch_rpc(
+                    [("trace_block", [hex_block])
+                     for hex_block in hex_blocks[start:start + MAX_RPC_BATCH_SIZE]]
+                )
+        
+        # Fetch block traces in batches, with several batches in flight at once
+        windows = await asyncio.gather(
+            *(fetch_window(start) for start in range(0, len(blocks), MAX_RPC_BATCH_SIZE))
+        )
+        responses = [response for window in windows for response in window]
         
-        for block_num in block_range:
-            traces = await self.analyze_block_transactions(block_num)
+        for block_num, response in zip(blocks, responses):
+            traces = await self.analyze_block_transactions(block_num, response)
             
             # Analyze transaction ordering and value extraction
             # This is a simplified example - real MEV detection would be more complex
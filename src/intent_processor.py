@@ -1,11 +1,39 @@
-from web3 import Web3
-from typing import Dict, List, Optional
+from web3 import AsyncWeb3
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import os
+import time
+import logging
 from dataclasses import dataclass
 import json
 import asyncio
+import numpy as np
 from eth_account.messages import encode_defunct
-from config import Network, BLOCKCHAIN_RPC_ENDPOINTS, PYUSD_ADDRESSES
+from config import Network, NETWORK_CONFIG, PYUSD_ADDRESSES, get_async_web3
+
+logger = logging.getLogger(__name__)
+
+# Seconds a fetched gas price stays valid
+GAS_PRICE_TTL = 3
+
+# Seconds between background gas price refreshes, kept below the TTL so the
+# cached value never expires while the refresher is running
+GAS_PRICE_REFRESH_INTERVAL = 2
+
+# Fields every intent must provide
+_REQUIRED_INTENT_FIELDS = frozenset({"user", "amount", "targetToken", "targetChain"})
+
+# Chain reads shared by all processors, keyed by (network, name) and stored
+# as (value, expires_at); an expiry of None means the value never changes
+_chain_cache: Dict[Tuple[Network, str], Tuple[Any, Optional[float]]] = {}
+
+# Fetches currently in flight, so concurrent cache misses share one RPC call
+_pending_fetches: Dict[Tuple[Network, str], "asyncio.Task[Any]"] = {}
+
+# Relative weight of cost, time and security risk when ranking routes
+DEFAULT_ROUTE_WEIGHTS = (1 / 3, 1 / 3, 1 / 3)
+
+# Fixed-point scale for quantized route metrics; 1.0 maps to 10_000, which fits in int16
+ROUTE_METRIC_SCALE = 10_000
 
 @dataclass
 class Route:
@@ -14,11 +42,115 @@ class Route:
     estimated_time: int
     security_score: float
 
+class RouteTable:
+    """
+    Candidate routes stored column-wise, so ranking them is a single
+    vectorized operation instead of per-route attribute access.
+
+    Security scores are kept as int16 fixed-point values and routes are ranked
+    with integer arithmetic; floats are only rebuilt for the selected route.
+    """
+
+    def __init__(self,
+                 steps: List[List[Dict]],
+                 total_cost: List[float],
+                 estimated_time: List[int],
+                 security_score: List[float]):
+        self.steps = steps
+        self.total_cost = np.asarray(total_cost, dtype=np.float64)
+        self.estimated_time = np.asarray(estimated_time, dtype=np.int64)
+        self.security_score_q = np.rint(
+            np.asarray(security_score, dtype=np.float64) * ROUTE_METRIC_SCALE
+        ).astype(np.int16)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def rank(self, weights: Tuple[float, float, float] = DEFAULT_ROUTE_WEIGHTS) -> np.ndarray:
+        """Return route indices ordered from best to worst by weighted cost, time and risk"""
+        # Integer weights in hundredths keep the composite score within int32
+        cost_weight, time_weight, risk_weight = np.rint(np.asarray(weights) * 100).astype(np.int32)
+        scores = (
+            cost_weight * _quantize(self.total_cost).astype(np.int32)
+            + time_weight * _quantize(self.estimated_time).astype(np.int32)
+            + risk_weight * (ROUTE_METRIC_SCALE - self.security_score_q.astype(np.int32))
+        )
+        return np.argsort(scores, kind="stable")
+
+    def route(self, index: int) -> Route:
+        """Build the object form of a single route"""
+        return Route(
+            steps=self.steps[index],
+            total_cost=float(self.total_cost[index]),
+            estimated_time=int(self.estimated_time[index]),
+            security_score=int(self.security_score_q[index]) / ROUTE_METRIC_SCALE
+        )
+
+def _quantize(column: np.ndarray) -> np.ndarray:
+    """Scale a column by its maximum into int16 fixed-point values in [0, ROUTE_METRIC_SCALE]"""
+    peak = column.max()
+    if peak <= 0:
+        return np.zeros(len(column), dtype=np.int16)
+    return np.rint(column / peak * ROUTE_METRIC_SCALE).astype(np.int16)
+
 class IntentProcessor:
     def __init__(self, network: Network = Network.ETHEREUM_MAINNET):
         self.network = network
-        self.w3 = Web3(Web3.HTTPProvider(BLOCKCHAIN_RPC_ENDPOINTS[network]))
+        self.w3: AsyncWeb3 = get_async_web3(network)
         self.pyusd_address = PYUSD_ADDRESSES[network]
+        self.block_number_ttl = NETWORK_CONFIG[network]["block_time"] / 2
+
+    async def _cached(self,
+                      key: str,
+                      ttl: Optional[float],
+                      fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached chain value, fetching it again once its TTL has expired.
+        Concurrent callers that miss the cache wait on the same fetch.
+        """
+        cache_key = (self.network, key)
+        now = time.monotonic()
+        entry = _chain_cache.get(cache_key)
+        if entry is not None and (entry[1] is None or entry[1] > now):
+            return entry[0]
+
+        pending = _pending_fetches.get(cache_key)
+        if pending is None:
+            async def fetch_and_store() -> Any:
+                value = await fetch()
+                self._store(key, value, ttl)
+                return value
+
+            pending = asyncio.create_task(fetch_and_store())
+            _pending_fetches[cache_key] = pending
+            pending.add_done_callback(lambda _: _pending_fetches.pop(cache_key, None))
+
+        # Shield the shared fetch so one cancelled request does not cancel it for the others
+        return await asyncio.shield(pending)
+
+    def _store(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store a chain value in the shared cache"""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        _chain_cache[(self.network, key)] = (value, expires_at)
+
+    async def warm_up(self) -> None:
+        """Open the RPC connection and prime the chain caches before serving requests"""
+        try:
+            await self._cached("chain_id", None, lambda: self.w3.eth.chain_id)
+            await self._cached(
+                "block_number", self.block_number_ttl, lambda: self.w3.eth.block_number
+            )
+        except Exception as e:
+            logger.warning(f"RPC warm-up failed: {str(e)}")
+
+    async def refresh_gas_price(self, interval: float = GAS_PRICE_REFRESH_INTERVAL) -> None:
+        """Keep the cached gas price fresh so requests do not wait on the RPC for it"""
+        while True:
+            try:
+                self._store("gas_price", await self.w3.eth.gas_price, GAS_PRICE_TTL)
+            except Exception as e:
+                logger.warning(f"Gas price refresh failed: {str(e)}")
+            await asyncio.sleep(interval)
 
     async def process_intent(self, intent: Dict) -> Dict:
         """Process a user's intent and find the optimal execution path"""
@@ -26,19 +158,20 @@ class IntentProcessor:
         # Validate intent
         self._validate_intent(intent)
         
-        # For testing, return a mock response
-        mock_route = Route(
-            steps=[{
+        # For testing, rank a single mock candidate
+        candidates = RouteTable(
+            steps=[[{
                 "type": "swap",
                 "from_token": "PYUSD",
                 "to_token": intent["targetToken"],
                 "amount": intent["amount"],
                 "expected_output": intent.get("minAmountOut", intent["amount"] * 0.995)
-            }],
-            total_cost=0.01,  # Mock gas cost in ETH
-            estimated_time=15,  # Seconds
-            security_score=0.95
+            }]],
+            total_cost=[0.01],  # Mock gas cost in ETH
+            estimated_time=[15],  # Seconds
+            security_score=[0.95]
         )
+        mock_route = candidates.route(candidates.rank()[0])
         
         return {
             "success": True,
@@ -53,23 +186,28 @@ class IntentProcessor:
                 "to": self.pyusd_address,
                 "value": "0x0",
                 "gas": 200000,
-                "gasPrice": self.w3.eth.gas_price
+                "gasPrice": await self._cached(
+                    "gas_price", GAS_PRICE_TTL, lambda: self.w3.eth.gas_price
+                )
             },
             "analytics": {
                 "gas_estimate": 200000,
                 "mev_risk": False,
                 "network_stats": {
-                    "current_block": self.w3.eth.block_number,
-                    "network_id": self.w3.eth.chain_id
+                    "current_block": await self._cached(
+                        "block_number", self.block_number_ttl, lambda: self.w3.eth.block_number
+                    ),
+                    "network_id": await self._cached(
+                        "chain_id", None, lambda: self.w3.eth.chain_id
+                    )
                 }
             }
         }
 
     def _validate_intent(self, intent: Dict) -> None:
-        required_fields = ["user", "amount", "targetToken", "targetChain"]
-        for field in required_fields:
-            if field not in intent:
-                raise ValueError(f"Missing required field: {field}")
+        missing = _REQUIRED_INTENT_FIELDS - intent.keys()
+        if missing:
+            raise ValueError(f"Missing required fields: {sorted(missing)}")
 
     async def monitor_transaction(self, tx_hash: str) -> Dict:
         """Monitor a transaction's status and provide updates"""
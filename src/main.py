@@ -1,11 +1,25 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Optional
 from intent_processor import IntentProcessor
+from pylot.rpc_session import close_session, use_shared_session
 import uvicorn
 
-app = FastAPI(title="Intent-Based Transaction System")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled RPC session and keep chain data warm for the lifetime of the server."""
+    await use_shared_session(intent_processor.w3.provider)
+    await intent_processor.warm_up()
+    gas_price_refresher = asyncio.create_task(intent_processor.refresh_gas_price())
+    yield
+    gas_price_refresher.cancel()
+    await close_session()
+
+app = FastAPI(title="Intent-Based Transaction System", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -25,17 +39,20 @@ async def health_check():
     return {"status": "healthy"}
 
 class Intent(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     user: str
     amount: float
     targetToken: str
     targetChain: str
-    minAmountOut: Optional[float]
-    deadline: Optional[int]
+    minAmountOut: Optional[float] = None
+    deadline: Optional[int] = None
 
 @app.post("/process-intent")
 async def process_intent(intent: Intent):
     try:
-        result = await intent_processor.process_intent(intent.dict())
+        # Unset optional fields are left out so the processor falls back to its defaults
+        result = await intent_processor.process_intent(intent.model_dump(exclude_none=True))
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -49,4 +66,11 @@ async def get_transaction_status(tx_hash: str):
         raise HTTPException(status_code=400, detail=str(e))
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
@@ -10,12 +10,9 @@ import sys
 from typing import Dict, Any, Optional
 
 from pylot.intent.parser import IntentParser, Intent
-from pylot.routing.optimizer import RoutingOptimizer
-from pylot.execution.base import TransactionExecutor
-from pylot.execution.transfer import TokenTransferExecutor
-from pylot.execution.swap import TokenSwapExecutor
-from pylot.execution.bridge import BridgeExecutor
-from pylot.integrations.gcp import GCPIntegration
+
+# Routing, execution and GCP modules pull in web3 and are imported inside
+# execute_intent so that argument parsing and --help stay fast
 
 # Set up logging
 logging.basicConfig(
@@ -116,6 +113,9 @@ def execute_intent(intent: Dict[str, Any]) -> bool:
     """
     logger.info(f"Processing intent: {intent}")
     
+    from pylot.integrations.gcp import GCPIntegration
+    from pylot.routing.optimizer import RoutingOptimizer
+    
     # Initialize GCP Blockchain RPC integration
     gcp_integration = GCPIntegration()
     
@@ -136,10 +136,13 @@ def execute_intent(intent: Dict[str, Any]) -> bool:
     
     # Initialize the appropriate executor based on intent type
     if intent["type"] == "transfer":
+        from pylot.execution.transfer import TokenTransferExecutor
         executor = TokenTransferExecutor(gcp_integration)
     elif intent["type"] == "swap":
+        from pylot.execution.swap import TokenSwapExecutor
         executor = TokenSwapExecutor(gcp_integration)
     elif intent["type"] == "bridge":
+        from pylot.execution.bridge import BridgeExecutor
         executor = BridgeExecutor(gcp_integration)
     else:
         logger.error(f"No executor available for intent type: {intent['type']}")
@@ -0,0 +1,48 @@
+"""
+Dataclass helpers.
+
+dataclass(slots=True) only exists from Python 3.10, and the App Engine runtime
+is Python 3.9, so slotted dataclasses are rebuilt with this decorator instead.
+"""
+
+from dataclasses import fields
+
+
+def slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass so its fields are stored in __slots__.
+
+    Mirrors what dataclass(slots=True) does: the class is recreated with
+    __slots__ set to its field names and the field defaults removed from the
+    class namespace (the generated __init__ keeps its own copy of them), and
+    frozen classes get pickle support.
+
+    Args:
+        cls: The class, already processed by @dataclass
+
+    Returns:
+        The slotted replacement class
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    if cls.__dataclass_params__.frozen:
+        # Default slot unpickling assigns attributes, which frozen classes forbid
+        namespace["__getstate__"] = _getstate
+        namespace["__setstate__"] = _setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _getstate(self) -> list:
+    """Pickle state of a slotted dataclass: its field values in order."""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _setstate(self, state: list) -> None:
+    """Restore a frozen slotted dataclass from its pickle state."""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
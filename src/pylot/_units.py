@@ -0,0 +1,55 @@
+"""
+PYUSD amount conversions.
+
+Amounts are carried internally as ints of PYUSD's smallest unit ("atoms",
+10**-6 PYUSD), so arithmetic on them is plain int arithmetic. They are
+converted from and to Decimal only where they enter or leave the system.
+"""
+
+from decimal import Decimal
+from typing import Union
+
+PYUSD_DECIMALS = 6
+
+# Basis points in one whole, for rates stored as integer basis points
+BPS = 10_000
+
+
+def to_atoms(amount: Union[Decimal, str, float, int]) -> int:
+    """
+    Convert a whole-PYUSD amount to atoms.
+
+    Strings are parsed directly and floats through their shortest repr, so
+    "0.1" and 0.1 give the same result.
+
+    Args:
+        amount: Amount in whole PYUSD
+
+    Returns:
+        int: Amount in atoms
+
+    Raises:
+        ValueError: If the amount has more than PYUSD_DECIMALS decimal places,
+            which cannot be represented in atoms
+    """
+    if type(amount) is int:
+        return amount * 10**PYUSD_DECIMALS
+    if not isinstance(amount, Decimal):
+        amount = Decimal(amount if isinstance(amount, str) else str(amount))
+    atoms = amount.scaleb(PYUSD_DECIMALS)
+    if atoms != atoms.to_integral_value():
+        raise ValueError(f"Amount {amount} has more than {PYUSD_DECIMALS} decimal places")
+    return int(atoms)
+
+
+def from_atoms(atoms: int) -> Decimal:
+    """
+    Convert an amount in atoms to whole PYUSD.
+
+    Args:
+        atoms: Amount in atoms
+
+    Returns:
+        Decimal: Amount in whole PYUSD, with PYUSD_DECIMALS decimal places
+    """
+    return Decimal(atoms).scaleb(-PYUSD_DECIMALS)
@@ -0,0 +1,212 @@
+"""
+Shared Multicall3 client for executor read calls.
+
+Executors frequently read the same kinds of values (token decimals,
+allowances) from the same chain. Instead of sending one eth_call per value,
+callers await Multicall3Client.call(), and every call queued within a short
+debounce window is packed into a single aggregate3 eth_call.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from web3 import AsyncWeb3, Web3
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# ERC-20 function selectors
+DECIMALS_SELECTOR = bytes.fromhex('313ce567')   # decimals()
+ALLOWANCE_SELECTOR = bytes.fromhex('dd62ed3e')  # allowance(address,address)
+BALANCE_OF_SELECTOR = bytes.fromhex('70a08231')  # balanceOf(address)
+
+# Seconds to wait for more calls before sending a batch
+DEFAULT_DEBOUNCE = 0.005
+
+# Provider attribute holding the provider's shared client. The client is
+# stored on the provider rather than in a module registry, so both are
+# collected together once no executor uses the provider.
+_CLIENT_ATTR = '_pylot_multicall_client'
+
+
+class Multicall3Client:
+    """
+    Coalesces read calls issued close together into one aggregate3 eth_call.
+
+    Identical (target, calldata) pairs queued in the same window share a
+    single sub-call. Each sub-call is sent with allowFailure set, so one
+    reverting call does not fail the rest of the batch.
+    """
+
+    def __init__(self, web3: Union[Web3, AsyncWeb3], debounce: float = DEFAULT_DEBOUNCE):
+        """
+        Initialize the Multicall3Client.
+
+        Args:
+            web3: Web3 or AsyncWeb3 instance for the chain the calls are made on
+            debounce: Seconds to wait for more calls before sending a batch
+        """
+        self.web3 = web3
+        self.is_async = isinstance(web3, AsyncWeb3)
+        self.debounce = debounce
+        self.contract = web3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        # Event loop that owns the pending futures and the flush timer
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[Tuple[str, bytes], asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks
+        self._flush_tasks: Set[asyncio.Future] = set()
+
+    async def call(self, target: str, data: bytes) -> bytes:
+        """
+        Queue a read call and wait for its result.
+
+        Args:
+            target: Checksum address of the contract to call
+            data: ABI-encoded calldata, including the function selector
+
+        Returns:
+            Raw return data of the call
+
+        Raises:
+            ValueError: If the call reverted
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._adopt_loop(loop)
+        key = (target, data)
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.debounce, self._schedule_flush)
+        return await asyncio.shield(future)
+
+    def _adopt_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Move the client to a new event loop, dropping the previous loop's batch.
+
+        The shared client outlives event loops (each asyncio.run() call has its
+        own), and a loop can close while calls are waiting out the debounce
+        window. Its timer then never fires, so the batch is abandoned here
+        instead of blocking every later call.
+
+        Args:
+            loop: The running event loop the client is now used from
+        """
+        old_loop, handle, batch = self._loop, self._flush_handle, self._pending
+        self._loop = loop
+        self._pending = {}
+        self._flush_handle = None
+        self._flush_tasks = set()
+        if old_loop is None or old_loop.is_closed():
+            return
+
+        def abandon() -> None:
+            if handle is not None:
+                handle.cancel()
+            error = RuntimeError("Multicall3 client moved to another event loop")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+
+        # The old loop may still be running in another thread
+        old_loop.call_soon_threadsafe(abandon)
+
+    def _schedule_flush(self) -> None:
+        """Take the queued calls and send them as one batch."""
+        self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: Dict[Tuple[str, bytes], asyncio.Future]) -> None:
+        """
+        Send a batch of calls through aggregate3 and resolve their futures.
+
+        Args:
+            batch: Futures keyed by (target, calldata)
+        """
+        keys: List[Tuple[str, bytes]] = list(batch)
+        calls = [(target, True, data) for target, data in keys]
+        aggregate = self.contract.functions.aggregate3(calls)
+        try:
+            if self.is_async:
+                results = await aggregate.call()
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(None, aggregate.call)
+        except Exception as e:
+            logger.error(f"Multicall3 batch of {len(calls)} calls failed: {str(e)}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, (success, return_data) in zip(keys, results):
+            future = batch[key]
+            if future.done():
+                continue
+            if success:
+                future.set_result(bytes(return_data))
+            else:
+                future.set_exception(ValueError(f"Multicall3 call to {key[0]} reverted"))
+
+
+def get_multicall_client(web3: Union[Web3, AsyncWeb3]) -> Multicall3Client:
+    """
+    Get the shared Multicall3 client for a web3 provider, creating it on first use.
+
+    Clients are per provider rather than per chain, since a client sends its
+    batches through the provider it was created with.
+
+    Args:
+        web3: Web3 or AsyncWeb3 instance, used if the client is created
+
+    Returns:
+        The provider's Multicall3Client
+    """
+    client = getattr(web3.provider, _CLIENT_ATTR, None)
+    if client is None:
+        client = Multicall3Client(web3)
+        setattr(web3.provider, _CLIENT_ATTR, client)
+    return client
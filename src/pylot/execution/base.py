@@ -7,13 +7,20 @@ transactions across different chains and protocols.
 """
 
 import abc
+import asyncio
 import logging
+import random
+import time
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 from web3.types import TxParams, TxReceipt
 
+# Seconds a fetched gas price is reused before querying the network again
+GAS_PRICE_CACHE_TTL = 3
+
 
 class TransactionStatus(Enum):
     """Enum for tracking the status of a transaction."""
@@ -45,6 +52,10 @@ class TransactionExecutor(abc.ABC):
         self.chain_id = chain_id
         self.logger = logger or logging.getLogger(__name__)
         
+        # Last fetched gas price as (price, monotonic fetch time)
+        self._gas_price_cache: Tuple[int, float] = (0, float('-inf'))
+        self._build = self._make_builder(chain_id)
+        
     @abc.abstractmethod
     def execute(self, transaction_data: Dict[str, Any]) -> str:
         """
@@ -98,26 +109,58 @@ class TransactionExecutor(abc.ABC):
         Returns:
             Transaction parameters dictionary
         """
-        tx_params: TxParams = {
-            'from': from_address,
-            'to': to_address,
-            'value': value,
-            'chainId': self.chain_id,
-        }
+        return self._build(from_address, to_address, value, data, gas_price, gas_limit)
+    
+    def _make_builder(self, chain_id: int) -> Callable[..., TxParams]:
+        """
+        Create a transaction builder specialized for the given chain.
         
-        if data:
-            tx_params['data'] = data
-            
-        if gas_price is not None:
-            tx_params['gasPrice'] = gas_price
-        else:
-            # Get current gas price from the network
-            tx_params['gasPrice'] = self.web3.eth.gas_price
-            
-        if gas_limit is not None:
-            tx_params['gas'] = gas_limit
+        The chain ID and gas price lookup are bound in the closure, so each
+        call only assembles the per-transaction fields.
+        
+        Args:
+            chain_id: The chain ID to bake into every transaction
             
-        return tx_params
+        Returns:
+            Function with the same parameters as build_transaction
+        """
+        get_gas_price = self._get_gas_price
+        
+        def build(from_address: str,
+                  to_address: str,
+                  value: int = 0,
+                  data: str = "",
+                  gas_price: Optional[int] = None,
+                  gas_limit: Optional[int] = None) -> TxParams:
+            tx_params: TxParams = {
+                'from': from_address,
+                'to': to_address,
+                'value': value,
+                'chainId': chain_id,
+            }
+            if data:
+                tx_params['data'] = data
+            # Fall back to the current network gas price
+            tx_params['gasPrice'] = gas_price if gas_price is not None else get_gas_price()
+            if gas_limit is not None:
+                tx_params['gas'] = gas_limit
+            return tx_params
+        
+        return build
+    
+    def _get_gas_price(self) -> int:
+        """
+        Get the current network gas price, reusing a recently fetched value.
+        
+        Returns:
+            Gas price in wei
+        """
+        price, fetched_at = self._gas_price_cache
+        now = time.monotonic()
+        if now - fetched_at > GAS_PRICE_CACHE_TTL:
+            price = self.web3.eth.gas_price
+            self._gas_price_cache = (price, now)
+        return price
     
     def get_transaction_status(self, tx_hash: str) -> TransactionStatus:
         """
@@ -138,10 +181,45 @@ class TransactionExecutor(abc.ABC):
                 return TransactionStatus.CONFIRMED
             else:
                 return TransactionStatus.REVERTED
+        except TransactionNotFound:
+            return TransactionStatus.PENDING
         except Exception as e:
             self.logger.error(f"Error getting transaction status: {str(e)}")
             return TransactionStatus.FAILED
     
+    async def wait_for_status(self,
+                              tx_hash: str,
+                              max_wait: float = 120,
+                              initial_delay: float = 0.5,
+                              max_delay: float = 12) -> TransactionStatus:
+        """
+        Wait until a transaction is no longer pending, polling with exponential backoff.
+        
+        Polls start quickly so fast confirmations are noticed early, then back off
+        with jitter up to max_delay to limit the number of RPC calls.
+        
+        Args:
+            tx_hash: Transaction hash
+            max_wait: Maximum time to wait in seconds
+            initial_delay: Delay before the second poll in seconds
+            max_delay: Upper bound for the delay between polls in seconds
+            
+        Returns:
+            Final TransactionStatus, or PENDING if max_wait elapsed first
+        """
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+        
+        while True:
+            # The receipt lookup is a blocking Web3 RPC, so it runs in a worker thread
+            status = await asyncio.to_thread(self.get_transaction_status, tx_hash)
+            remaining = deadline - time.monotonic()
+            if status != TransactionStatus.PENDING or remaining <= 0:
+                return status
+            
+            await asyncio.sleep(min(delay * random.uniform(0.8, 1.2), remaining))
+            delay = min(delay * 1.6, max_delay)
+    
     def wait_for_transaction(self, tx_hash: str, timeout: int = 120) -> TxReceipt:
         """
         Wait for a transaction to be mined and return the receipt.
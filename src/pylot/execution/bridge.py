@@ -1,36 +1,113 @@
+import asyncio
 import time
-from typing import Dict, List, Optional, Tuple, Union
+from enum import Enum
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 from decimal import Decimal
-from web3 import Web3
 
+import numpy as np
+from eth_abi import decode, encode
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TransactionNotFound
+
+from pylot.execution._multicall import ALLOWANCE_SELECTOR, get_multicall_client
 from pylot.execution.base import TransactionExecutor
 from pylot.integrations.gcp import GCPIntegration
 
-class BridgeProtocol:
-    """Enum-like class to represent supported bridge protocols"""
-    STARGATE = "stargate"
-    HOP = "hop"
-    LAYERZERO = "layerzero"
-    ACROSS = "across"
-    SYNAPSE = "synapse"
+# Wei per whole PYUSD/ETH unit, for 18-decimal amount conversions
+WEI18 = 10**18
+
+# Maximum ERC-20 allowance, approved once per (owner, spender, token, chain)
+MAX_UINT256 = 2**256 - 1
+
+# Upper bound for fee arithmetic in int64 arrays
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _to_wei18(amount: Union[int, float, Decimal]) -> int:
+    """
+    Convert an amount of an 18-decimal token to wei.
+    
+    Ints are taken to already be in wei. The exact type check is a fast path
+    for that common case; floats and Decimals are scaled to wei.
+    """
+    if type(amount) is int:
+        return amount
+    if isinstance(amount, (float, Decimal)):
+        return int(Decimal(str(amount)) * WEI18)
+    return amount
+
+
+class _IndexedEnum(Enum):
+    """
+    Enum valued by its index in lookup tables.
+    
+    Members index tuples directly through __index__, but unlike IntEnum they
+    never compare equal to ints or to members of another indexed enum, so
+    protocols and chains cannot collide as dict or set keys.
+    """
+    
+    def __index__(self) -> int:
+        return self._value_
+
+class BridgeProtocol(_IndexedEnum):
+    """Supported bridge protocols, valued by their index in the protocol tables"""
+    STARGATE = 0
+    HOP = 1
+    LAYERZERO = 2
+    ACROSS = 3
+    SYNAPSE = 4
     
     @classmethod
-    def all(cls) -> List[str]:
+    def all(cls) -> List["BridgeProtocol"]:
         """Return a list of all supported protocols"""
-        return [cls.STARGATE, cls.HOP, cls.LAYERZERO, cls.ACROSS, cls.SYNAPSE]
+        return list(cls)
+    
+    @classmethod
+    def parse(cls, value: Union[str, "BridgeProtocol"]) -> "BridgeProtocol":
+        """Translate an external protocol name such as "stargate" into a BridgeProtocol"""
+        if type(value) is cls:
+            return value
+        protocol = _STR_TO_PROTOCOL.get(value)
+        if protocol is None:
+            raise ValueError(f"Unsupported bridge protocol: {value}")
+        return protocol
+    
+    @property
+    def label(self) -> str:
+        """External name of the protocol"""
+        return self.name.lower()
 
-class Chain:
-    """Enum-like class to represent supported chains"""
-    ETHEREUM = "ethereum"
-    ARBITRUM = "arbitrum"
-    OPTIMISM = "optimism"
-    BASE = "base"
-    POLYGON = "polygon"
+class Chain(_IndexedEnum):
+    """Supported chains, valued by their index in the chain tables"""
+    ETHEREUM = 0
+    ARBITRUM = 1
+    OPTIMISM = 2
+    BASE = 3
+    POLYGON = 4
     
     @classmethod
-    def all(cls) -> List[str]:
+    def all(cls) -> List["Chain"]:
         """Return a list of all supported chains"""
-        return [cls.ETHEREUM, cls.ARBITRUM, cls.OPTIMISM, cls.BASE, cls.POLYGON]
+        return list(cls)
+    
+    @classmethod
+    def parse(cls, value: Union[str, "Chain"]) -> "Chain":
+        """Translate an external chain name such as "ethereum" into a Chain"""
+        if type(value) is cls:
+            return value
+        chain = _STR_TO_CHAIN.get(value)
+        if chain is None:
+            raise ValueError(f"Unsupported chain: {value}")
+        return chain
+    
+    @property
+    def label(self) -> str:
+        """External name of the chain"""
+        return self.name.lower()
+
+# Ingress translation from the string names used by external APIs
+_STR_TO_PROTOCOL: Dict[str, BridgeProtocol] = {p.label: p for p in BridgeProtocol}
+_STR_TO_CHAIN: Dict[str, Chain] = {c.label: c for c in Chain}
 
 class BridgeExecutor(TransactionExecutor):
     """
@@ -40,41 +117,84 @@ class BridgeExecutor(TransactionExecutor):
     using various bridge protocols like Stargate, Hop, LayerZero, etc.
     """
     
-    # Protocol router contract addresses per chain
-    PROTOCOL_ROUTERS = {
-        BridgeProtocol.STARGATE: {
-            Chain.ETHEREUM: "0x8731d54E9D02c286767d56ac03e8037C07e01e98",
-            Chain.ARBITRUM: "0x53Bf833A5d6c4ddA888F69c22C88C9f356a41614",
-            Chain.OPTIMISM: "0xB0D502E938ed5f4df2E681fE6E419ff29631d62b",
-            Chain.BASE: "0x45f1fF3190159Ac2396242aE7F74e0C021f84476",
-            Chain.POLYGON: "0x45A01E4e04F14f7A4a6702c74187c5F6222033cd"
-        },
-        BridgeProtocol.HOP: {
-            Chain.ETHEREUM: "0x3666f603Cc164936C1b87e207F36BEBa4AC5f18a",
-            Chain.ARBITRUM: "0x3E4a3a4796d16c0Cd582C382691998f7c06420B6",
-            Chain.OPTIMISM: "0x2ad09850b0CA4c7c1B33f5AcD6cBAbCaB5d6e796",
-            Chain.BASE: "0x2A6303e6b99d451Df3566068EBb110708335658f",
-            Chain.POLYGON: "0x8741Ba6225A6BF91f9D73531A98A89807857a2B3"
-        }
-    }
+    # Protocol router contract addresses, indexed by BridgeProtocol then Chain.
+    # Protocols without routers map to an empty tuple.
+    PROTOCOL_ROUTERS: Tuple[Tuple[str, ...], ...] = (
+        # BridgeProtocol.STARGATE
+        (
+            "0x8731d54E9D02c286767d56ac03e8037C07e01e98",  # Chain.ETHEREUM
+            "0x53Bf833A5d6c4ddA888F69c22C88C9f356a41614",  # Chain.ARBITRUM
+            "0xB0D502E938ed5f4df2E681fE6E419ff29631d62b",  # Chain.OPTIMISM
+            "0x45f1fF3190159Ac2396242aE7F74e0C021f84476",  # Chain.BASE
+            "0x45A01E4e04F14f7A4a6702c74187c5F6222033cd"   # Chain.POLYGON
+        ),
+        # BridgeProtocol.HOP
+        (
+            "0x3666f603Cc164936C1b87e207F36BEBa4AC5f18a",  # Chain.ETHEREUM
+            "0x3E4a3a4796d16c0Cd582C382691998f7c06420B6",  # Chain.ARBITRUM
+            "0x2ad09850b0CA4c7c1B33f5AcD6cBAbCaB5d6e796",  # Chain.OPTIMISM
+            "0x2A6303e6b99d451Df3566068EBb110708335658f",  # Chain.BASE
+            "0x8741Ba6225A6BF91f9D73531A98A89807857a2B3"   # Chain.POLYGON
+        ),
+        (),  # BridgeProtocol.LAYERZERO
+        (),  # BridgeProtocol.ACROSS
+        (),  # BridgeProtocol.SYNAPSE
+    )
+    
+    # Protocol fees in basis points of the bridged amount, indexed by BridgeProtocol
+    DEFAULT_FEE_BPS = 10              # 0.1%
+    FEE_BPS: Tuple[int, ...] = (
+        6,                # BridgeProtocol.STARGATE, 0.06%
+        4,                # BridgeProtocol.HOP, 0.04%
+        DEFAULT_FEE_BPS,  # BridgeProtocol.LAYERZERO
+        DEFAULT_FEE_BPS,  # BridgeProtocol.ACROSS
+        DEFAULT_FEE_BPS,  # BridgeProtocol.SYNAPSE
+    )
+    
+    # Fixed gas fee assumed for protocols without a gas estimator (0.001 ETH)
+    DEFAULT_GAS_FEE_WEI = 10**15
     
-    # Chain IDs used by bridge protocols
-    CHAIN_IDS = {
-        Chain.ETHEREUM: 1,
-        Chain.ARBITRUM: 42161,
-        Chain.OPTIMISM: 10,
-        Chain.BASE: 8453,
-        Chain.POLYGON: 137
-    }
+    # Chain IDs used by bridge protocols, indexed by Chain
+    CHAIN_IDS: Tuple[int, ...] = (
+        1,      # Chain.ETHEREUM
+        42161,  # Chain.ARBITRUM
+        10,     # Chain.OPTIMISM
+        8453,   # Chain.BASE
+        137     # Chain.POLYGON
+    )
     
-    # PYUSD token addresses on different chains
-    PYUSD_ADDRESSES = {
-        Chain.ETHEREUM: "0x6c3ea9036406852006290770BEdFcAbA0e23A0e8",
-        Chain.ARBITRUM: "0xfd9ac3ce15c6acb283690624687a99d351704169",
-        Chain.OPTIMISM: "0xcd7169D55d8cff1183ef0e1E701e549997Cf471F",
-        Chain.BASE: "0xB37B6B5685B89802EfE00116330C98c504CbD168",
-        Chain.POLYGON: "0x34a13e66a0de47c3ad16f47f0d0ca3e7a2e91ee9"
-    }
+    # PYUSD token addresses on different chains, indexed by Chain
+    PYUSD_ADDRESSES: Tuple[str, ...] = (
+        "0x6c3ea9036406852006290770BEdFcAbA0e23A0e8",  # Chain.ETHEREUM
+        "0xfd9ac3ce15c6acb283690624687a99d351704169",  # Chain.ARBITRUM
+        "0xcd7169D55d8cff1183ef0e1E701e549997Cf471F",  # Chain.OPTIMISM
+        "0xB37B6B5685B89802EfE00116330C98c504CbD168",  # Chain.BASE
+        "0x34a13e66a0de47c3ad16f47f0d0ca3e7a2e91ee9"   # Chain.POLYGON
+    )
+    
+    # Minimal ERC-20 ABI for allowance management
+    ERC20_ABI = [
+        {
+            "constant": True,
+            "inputs": [
+                {"name": "_owner", "type": "address"},
+                {"name": "_spender", "type": "address"}
+            ],
+            "name": "allowance",
+            "outputs": [{"name": "", "type": "uint256"}],
+            "type": "function"
+        },
+        {
+            "constant": False,
+            "inputs": [
+                {"name": "_spender", "type": "address"},
+                {"name": "_value", "type": "uint256"}
+            ],
+            "name": "approve",
+            "outputs": [{"name": "", "type": "bool"}],
+            "type": "function"
+        }
+    ]
     
     def __init__(self, gcp_integration: GCPIntegration):
         """
@@ -85,8 +205,43 @@ class BridgeExecutor(TransactionExecutor):
         """
         super().__init__(gcp_integration)
         self.protocols = BridgeProtocol.all()
+        
+        # Chains each protocol has a router on, indexed by BridgeProtocol
+        self._protocol_chains: Tuple[FrozenSet[Chain], ...] = tuple(
+            frozenset(Chain(index) for index in range(len(routers)))
+            for routers in self.PROTOCOL_ROUTERS
+        )
+        
+        # Web3 instances per chain, created on first use
+        self._w3: Dict[Chain, AsyncWeb3] = {}
+        
+        # Known allowances keyed by (owner, spender, token, chain)
+        self._allowance_cache: Dict[Tuple[str, str, str, Chain], int] = {}
+        
+        # Arrival time estimates keyed by (protocol, source chain, dest chain)
+        self._arrival_table: Dict[Tuple[BridgeProtocol, Chain, Chain], int] = {}
     
-    def get_supported_protocols(self, source_chain: str, dest_chain: str) -> List[str]:
+    async def _w3_for(self, chain: Chain) -> AsyncWeb3:
+        """
+        Get the AsyncWeb3 instance for a chain, reusing it across calls.
+        
+        Args:
+            chain: Blockchain
+            
+        Returns:
+            AsyncWeb3 instance connected to the chain
+        """
+        w3 = self._w3.get(chain)
+        if w3 is None:
+            w3 = await self.gcp_integration.get_async_web3(chain.label)
+            self._w3[chain] = w3
+        return w3
+    
+    def get_supported_protocols(
+        self,
+        source_chain: Union[str, Chain],
+        dest_chain: Union[str, Chain]
+    ) -> List[str]:
         """
         Get list of supported bridge protocols for the given chain pair.
         
@@ -95,22 +250,22 @@ class BridgeExecutor(TransactionExecutor):
             dest_chain: Destination blockchain
             
         Returns:
-            List of protocol names that support this chain pair
+            External names (such as "stargate") of the protocols that
+            support this chain pair
         """
-        supported = []
-        
-        for protocol in self.protocols:
-            if (source_chain in self.PROTOCOL_ROUTERS.get(protocol, {}) and 
-                dest_chain in self.PROTOCOL_ROUTERS.get(protocol, {})):
-                supported.append(protocol)
-                
-        return supported
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
+        return [
+            protocol.label for protocol in BridgeProtocol
+            if source_chain in self._protocol_chains[protocol]
+            and dest_chain in self._protocol_chains[protocol]
+        ]
     
     def estimate_bridge_fee(
         self, 
-        protocol: str, 
-        source_chain: str, 
-        dest_chain: str, 
+        protocol: Union[str, BridgeProtocol], 
+        source_chain: Union[str, Chain], 
+        dest_chain: Union[str, Chain], 
         amount: Union[int, float, Decimal]
     ) -> Dict[str, Union[int, float]]:
         """
@@ -125,52 +280,128 @@ class BridgeExecutor(TransactionExecutor):
         Returns:
             Dictionary with fee details including protocol fee, gas fee, and total fee
         """
-        if protocol not in self.protocols:
-            raise ValueError(f"Unsupported bridge protocol: {protocol}")
-            
-        if source_chain not in self.CHAIN_IDS or dest_chain not in self.CHAIN_IDS:
-            raise ValueError(f"Unsupported chain pair: {source_chain} to {dest_chain}")
+        protocol = BridgeProtocol.parse(protocol)
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
         
         # Convert to wei if needed
-        amount_wei = amount
-        if isinstance(amount, (float, Decimal)):
-            amount_wei = Web3.to_wei(amount, 'ether')
-        
-        # Get the web3 instance for the source chain
-        web3 = self.gcp_integration.get_web3(source_chain)
+        amount_wei = _to_wei18(amount)
         
         # Simulate fee estimation logic - this would need to be implemented 
-        # with actual contract calls in a production environment
-        if protocol == BridgeProtocol.STARGATE:
-            # Stargate typically charges 0.06% + fixed fee
-            protocol_fee = amount_wei * 0.0006
-            gas_fee = self._estimate_stargate_gas(source_chain, dest_chain)
-            total_fee = protocol_fee + gas_fee
-            
-        elif protocol == BridgeProtocol.HOP:
-            # Hop typically charges 0.04% + fixed fee depending on the chain
-            protocol_fee = amount_wei * 0.0004
-            gas_fee = self._estimate_hop_gas(source_chain, dest_chain)
-            total_fee = protocol_fee + gas_fee
-            
-        else:
-            # Default estimation for other protocols
-            protocol_fee = amount_wei * 0.001  # 0.1%
-            gas_fee = 0.001 * 10**18  # 0.001 ETH equivalent
-            total_fee = protocol_fee + gas_fee
+        # with actual contract calls in a production environment.
+        # Fees stay in integer wei; float multiplication loses precision above 2**53.
+        protocol_fee = amount_wei * self.FEE_BPS[protocol] // 10_000
+        gas_fee = self._estimate_gas_fee(protocol, source_chain, dest_chain)
+        total_fee = protocol_fee + gas_fee
             
         return {
             "protocol_fee": protocol_fee,
             "gas_fee": gas_fee,
             "total_fee": total_fee,
-            "total_fee_eth": Web3.from_wei(int(total_fee), 'ether')
+            "total_fee_eth": Decimal(total_fee).scaleb(-18)
         }
     
+    def estimate_bridge_fees_batch(
+        self,
+        protocols: List[Union[str, BridgeProtocol]],
+        source_chain: Union[str, Chain],
+        dest_chain: Union[str, Chain],
+        amounts: List[int]
+    ) -> np.ndarray:
+        """
+        Estimate bridge fees for every (amount, protocol) combination at once.
+        
+        Protocol fees are computed with a single broadcast over the amounts and
+        the protocols' basis points, and gas fees are estimated once per protocol.
+        
+        Args:
+            protocols: Bridge protocol names
+            source_chain: Source blockchain
+            dest_chain: Destination blockchain
+            amounts: Amounts of PYUSD to bridge, in wei
+            
+        Returns:
+            Structured array of shape (len(amounts), len(protocols)) with
+            protocol_fee, gas_fee and total_fee fields, in wei
+        """
+        protocols = [BridgeProtocol.parse(protocol) for protocol in protocols]
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
+        
+        bps_list = [self.FEE_BPS[protocol] for protocol in protocols]
+        gas_list = [self._estimate_gas_fee(protocol, source_chain, dest_chain) for protocol in protocols]
+        
+        # Use int64 when every product fits; wei amounts of 18-decimal tokens
+        # often overflow it, so fall back to exact Python ints in an object array
+        max_bps = max(bps_list, default=1) or 1
+        max_amount = max(amounts, default=0)
+        max_gas = max(gas_list, default=0)
+        if max_amount <= _INT64_MAX // max_bps and max_amount + max_gas <= _INT64_MAX:
+            dtype = np.int64
+        else:
+            dtype = object
+        
+        amt = np.asarray(amounts, dtype=dtype)
+        bps = np.asarray(bps_list, dtype=dtype)
+        gas = np.asarray(gas_list, dtype=dtype)
+        
+        fees = np.empty(
+            (len(amt), len(bps)),
+            dtype=[("protocol_fee", dtype), ("gas_fee", dtype), ("total_fee", dtype)]
+        )
+        fees["protocol_fee"] = amt[:, None] * bps[None, :] // 10_000
+        fees["gas_fee"] = gas[None, :]
+        fees["total_fee"] = fees["protocol_fee"] + fees["gas_fee"]
+        return fees
+    
+    def _estimate_gas_fee(self, protocol: BridgeProtocol, source_chain: Chain, dest_chain: Chain) -> int:
+        """
+        Estimate the gas fee, in wei, of bridging with a protocol.
+        
+        Args:
+            protocol: Bridge protocol name
+            source_chain: Source blockchain
+            dest_chain: Destination blockchain
+            
+        Returns:
+            Estimated gas fee in wei
+        """
+        if protocol == BridgeProtocol.STARGATE:
+            # Stargate typically charges 0.06% + fixed fee
+            return self._estimate_stargate_gas(source_chain, dest_chain)
+        if protocol == BridgeProtocol.HOP:
+            # Hop typically charges 0.04% + fixed fee depending on the chain
+            return self._estimate_hop_gas(source_chain, dest_chain)
+        # Default estimation for other protocols
+        return self.DEFAULT_GAS_FEE_WEI
+    
+    def _arrival_time(self, protocol: BridgeProtocol, source_chain: Chain, dest_chain: Chain) -> int:
+        """
+        Get the estimated arrival time for a route, computing it once per route.
+        
+        Arrival times are a static per-route policy, so fee estimation loops
+        look them up instead of re-estimating on every call.
+        
+        Args:
+            protocol: Bridge protocol
+            source_chain: Source blockchain
+            dest_chain: Destination blockchain
+            
+        Returns:
+            Estimated arrival time
+        """
+        key = (protocol, source_chain, dest_chain)
+        arrival_time = self._arrival_table.get(key)
+        if arrival_time is None:
+            arrival_time = self._estimate_arrival_time(protocol, source_chain, dest_chain)
+            self._arrival_table[key] = arrival_time
+        return arrival_time
+    
     def estimate_destination_amount(
         self, 
-        protocol: str, 
-        source_chain: str, 
-        dest_chain: str, 
+        protocol: Union[str, BridgeProtocol], 
+        source_chain: Union[str, Chain], 
+        dest_chain: Union[str, Chain], 
         amount: Union[int, float, Decimal]
     ) -> Dict[str, Union[int, float, Decimal]]:
         """
@@ -185,31 +416,33 @@ class BridgeExecutor(TransactionExecutor):
         Returns:
             Dictionary with amount details including fees and final amount
         """
+        protocol = BridgeProtocol.parse(protocol)
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
+        
         # Get fee estimation
         fee_data = self.estimate_bridge_fee(protocol, source_chain, dest_chain, amount)
         
         # Convert to wei if needed
-        amount_wei = amount
-        if isinstance(amount, (float, Decimal)):
-            amount_wei = Web3.to_wei(amount, 'ether')
+        amount_wei = _to_wei18(amount)
             
         # Calculate destination amount after fees
-        dest_amount_wei = amount_wei - int(fee_data["protocol_fee"])
+        dest_amount_wei = amount_wei - fee_data["protocol_fee"]
         
         return {
             "source_amount": amount_wei,
-            "source_amount_readable": Web3.from_wei(amount_wei, 'ether'),
+            "source_amount_readable": Decimal(amount_wei).scaleb(-18),
             "protocol_fee": fee_data["protocol_fee"],
             "destination_amount": dest_amount_wei,
-            "destination_amount_readable": Web3.from_wei(dest_amount_wei, 'ether'),
-            "estimated_arrival_time": self._estimate_arrival_time(protocol, source_chain, dest_chain)
+            "destination_amount_readable": Decimal(dest_amount_wei).scaleb(-18),
+            "estimated_arrival_time": self._arrival_time(protocol, source_chain, dest_chain)
         }
     
     async def execute_bridge(
         self,
-        protocol: str,
-        source_chain: str,
-        dest_chain: str,
+        protocol: Union[str, BridgeProtocol],
+        source_chain: Union[str, Chain],
+        dest_chain: Union[str, Chain],
         amount: Union[int, float, Decimal],
         sender_address: str,
         recipient_address: str,
@@ -217,7 +450,8 @@ class BridgeExecutor(TransactionExecutor):
         gas_price_gwei: Optional[int] = None,
         max_fee_per_gas: Optional[int] = None,
         max_priority_fee_per_gas: Optional[int] = None,
-        slippage_tolerance: float = 0.005  # 0.5% default slippage tolerance
+        slippage_tolerance: float = 0.005,  # 0.5% default slippage tolerance
+        slippage_bps: Optional[int] = None
     ) -> Dict:
         """
         Execute a bridge transaction to transfer PYUSD across chains.
@@ -233,27 +467,31 @@ class BridgeExecutor(TransactionExecutor):
             gas_price_gwei: Optional gas price in gwei (for legacy transactions)
             max_fee_per_gas: Optional max fee per gas (for EIP-1559 transactions)
             max_priority_fee_per_gas: Optional max priority fee (for EIP-1559 transactions)
-            slippage_tolerance: Slippage tolerance percentage (0.005 = 0.5%)
+            slippage_tolerance: Slippage tolerance percentage (0.005 = 0.5%).
+                Deprecated in favour of slippage_bps.
+            slippage_bps: Slippage tolerance in basis points (50 = 0.5%); takes
+                precedence over slippage_tolerance when given
             
         Returns:
             Dictionary with transaction details
         """
-        if protocol not in self.protocols:
-            raise ValueError(f"Unsupported bridge protocol: {protocol}")
+        protocol = BridgeProtocol.parse(protocol)
             
         # Validate chains are supported
-        if source_chain not in self.CHAIN_IDS:
-            raise ValueError(f"Unsupported source chain: {source_chain}")
-        if dest_chain not in self.CHAIN_IDS:
-            raise ValueError(f"Unsupported destination chain: {dest_chain}")
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
+        if source_chain not in self._protocol_chains[protocol]:
+            raise ValueError(f"{protocol.label} has no router on {source_chain.label}")
         
         # Get web3 instance for source chain
-        web3 = self.gcp_integration.get_web3(source_chain)
+        web3 = await self._w3_for(source_chain)
         
         # Convert amount to wei if needed
-        amount_wei = amount
-        if isinstance(amount, (float, Decimal)):
-            amount_wei = Web3.to_wei(amount, 'ether')
+        amount_wei = _to_wei18(amount)
+        
+        # Slippage stays in integer basis points to avoid float math on wei
+        if slippage_bps is None:
+            slippage_bps = round(slippage_tolerance * 10_000)
         
         # Prepare transaction parameters
         tx_params = self._prepare_bridge_tx_params(
@@ -266,7 +504,7 @@ class BridgeExecutor(TransactionExecutor):
             gas_price_gwei=gas_price_gwei,
             max_fee_per_gas=max_fee_per_gas,
             max_priority_fee_per_gas=max_priority_fee_per_gas,
-            slippage_tolerance=slippage_tolerance
+            slippage_bps=slippage_bps
         )
         
         # Check token allowance and approve if needed
@@ -276,7 +514,8 @@ class BridgeExecutor(TransactionExecutor):
             owner_address=sender_address,
             spender_address=self.PROTOCOL_ROUTERS[protocol][source_chain],
             amount=amount_wei,
-            private_key=private_key
+            private_key=private_key,
+            chain=source_chain
         )
         
         # Execute the bridge transaction
@@ -285,25 +524,35 @@ class BridgeExecutor(TransactionExecutor):
         # Wait for transaction receipt
         receipt = await self._wait_for_transaction_receipt(web3, tx_hash)
         
+        # The bridge pulled the tokens, so spend them from the cached allowance
+        allowance_key = (
+            sender_address,
+            self.PROTOCOL_ROUTERS[protocol][source_chain],
+            self.PYUSD_ADDRESSES[source_chain],
+            source_chain
+        )
+        if receipt.status == 1 and allowance_key in self._allowance_cache:
+            self._allowance_cache[allowance_key] -= amount_wei
+        
         return {
             "transaction_hash": tx_hash.hex(),
             "status": "success" if receipt.status == 1 else "failed",
             "block_number": receipt.blockNumber,
             "gas_used": receipt.gasUsed,
-            "source_chain": source_chain,
-            "destination_chain": dest_chain,
-            "protocol": protocol,
-            "amount": Web3.from_wei(amount_wei, 'ether'),
+            "source_chain": source_chain.label,
+            "destination_chain": dest_chain.label,
+            "protocol": protocol.label,
+            "amount": Decimal(amount_wei).scaleb(-18),
             "sender": sender_address,
             "recipient": recipient_address,
-            "estimated_arrival_time": self._estimate_arrival_time(protocol, source_chain, dest_chain)
+            "estimated_arrival_time": self._arrival_time(protocol, source_chain, dest_chain)
         }
     
     async def get_bridge_status(
         self,
-        protocol: str,
-        source_chain: str,
-        dest_chain: str,
+        protocol: Union[str, BridgeProtocol],
+        source_chain: Union[str, Chain],
+        dest_chain: Union[str, Chain],
         tx_hash: str
     ) -> Dict:
         """
@@ -318,31 +567,53 @@ class BridgeExecutor(TransactionExecutor):
         Returns:
             Dictionary with status details
         """
+        protocol = BridgeProtocol.parse(protocol)
+        source_chain = Chain.parse(source_chain)
+        dest_chain = Chain.parse(dest_chain)
+        
         # Get web3 instance for source chain
-        web3_source = self.gcp_integration.get_web3(source_chain)
+        web3_source = await self._w3_for(source_chain)
+        
+        # The destination check only needs the hash, so it runs alongside
+        # the source receipt lookup instead of after it
+        if protocol == BridgeProtocol.STARGATE:
+            dest_task = asyncio.ensure_future(
+                self._check_stargate_status(source_chain, dest_chain, tx_hash)
+            )
+        elif protocol == BridgeProtocol.HOP:
+            dest_task = asyncio.ensure_future(
+                self._check_hop_status(source_chain, dest_chain, tx_hash)
+            )
+        else:
+            dest_task = None
         
-        # Check source chain transaction first
+        # Check source chain transaction
         try:
-            receipt = web3_source.eth.get_transaction_receipt(tx_hash)
-            if not receipt or receipt.status != 1:
-                return {
-                    "status": "failed" if receipt else "pending",
-                    "source_chain_status": "failed" if receipt and receipt.status == 0 else "pending",
-                    "destination_chain_status": "not_started",
-                    "tx_hash": tx_hash
-                }
+            receipt = await web3_source.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            receipt = None
         except Exception as e:
+            if dest_task is not None:
+                dest_task.cancel()
             return {
                 "status": "error",
                 "error": str(e),
                 "tx_hash": tx_hash
             }
+        
+        if not receipt or receipt.status != 1:
+            if dest_task is not None:
+                dest_task.cancel()
+            return {
+                "status": "failed" if receipt else "pending",
+                "source_chain_status": "failed" if receipt and receipt.status == 0 else "pending",
+                "destination_chain_status": "not_started",
+                "tx_hash": tx_hash
+            }
             
         # Protocol-specific status checking logic
-        if protocol == BridgeProtocol.STARGATE:
-            return await self._check_stargate_status(source_chain, dest_chain, tx_hash)
-        elif protocol == BridgeProtocol.HOP:
-            return await self._check_hop_status(source_chain, dest_chain, tx_hash)
+        if dest_task is not None:
+            return await dest_task
         else:
             # Default status check for other protocols
             return {
@@ -350,6 +621,92 @@ class BridgeExecutor(TransactionExecutor):
                 "source_chain_status": "completed" if receipt.status == 1 else "failed",
                 "destination_chain_status": "unknown",
                 "tx_hash": tx_hash,
-                "protocol": protocol,
-                "message": f"Detailed status checking not implemented for {protocol} protocol"
+                "protocol": protocol.label,
+                "message": f"Detailed status checking not implemented for {protocol.label} protocol"
             }
+    
+    async def _check_and_approve_token(
+        self,
+        web3: AsyncWeb3,
+        token_address: str,
+        owner_address: str,
+        spender_address: str,
+        amount: int,
+        private_key: str,
+        chain: Chain
+    ) -> None:
+        """
+        Make sure the spender can pull the amount of tokens from the owner.
+        
+        Allowances are cached per (owner, spender, token, chain), so the
+        allowance is only read from the chain when the cached value does not
+        cover the amount. Approvals are for the maximum allowance, so repeat
+        bridges along the same route need no further approval transactions.
+        
+        Args:
+            web3: AsyncWeb3 instance for the chain holding the tokens
+            token_address: Address of the token
+            owner_address: Address of the token owner
+            spender_address: Address allowed to spend the tokens
+            amount: Amount that needs to be spendable, in wei
+            private_key: Private key of the owner, used to sign an approval
+            chain: Blockchain the token lives on
+        """
+        key = (owner_address, spender_address, token_address, chain)
+        if self._allowance_cache.get(key, 0) >= amount:
+            return
+        
+        token_address = Web3.to_checksum_address(token_address)
+        owner = Web3.to_checksum_address(owner_address)
+        spender = Web3.to_checksum_address(spender_address)
+        
+        # Read through the shared per-provider client so concurrent checks share one eth_call
+        multicall = get_multicall_client(web3)
+        return_data = await multicall.call(
+            token_address, ALLOWANCE_SELECTOR + encode(['address', 'address'], [owner, spender])
+        )
+        allowance = decode(['uint256'], return_data)[0]
+        if allowance >= amount:
+            self._allowance_cache[key] = allowance
+            return
+        
+        token = web3.eth.contract(address=token_address, abi=self.ERC20_ABI)
+        tx_params = await token.functions.approve(spender, MAX_UINT256).build_transaction({
+            "from": owner,
+            "nonce": await web3.eth.get_transaction_count(owner)
+        })
+        tx_hash = await self._send_transaction(web3, tx_params, private_key)
+        receipt = await self._wait_for_transaction_receipt(web3, tx_hash)
+        
+        if receipt.status != 1:
+            raise ValueError(f"Token approval failed: {tx_hash.hex()}")
+        self._allowance_cache[key] = MAX_UINT256
+    
+    async def _send_transaction(self, web3: AsyncWeb3, tx_params: Dict, private_key: str) -> bytes:
+        """
+        Sign a transaction locally and send it.
+        
+        Args:
+            web3: AsyncWeb3 instance for the chain to send on
+            tx_params: Transaction parameters
+            private_key: Private key for transaction signing
+            
+        Returns:
+            Transaction hash
+        """
+        signed_tx = web3.eth.account.sign_transaction(tx_params, private_key)
+        return await web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    
+    async def _wait_for_transaction_receipt(self, web3: AsyncWeb3, tx_hash: bytes, timeout: int = 300):
+        """
+        Wait for a transaction to be mined.
+        
+        Args:
+            web3: AsyncWeb3 instance for the chain the transaction was sent on
+            tx_hash: Transaction hash
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Transaction receipt
+        """
+        return await web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
@@ -5,14 +5,28 @@ This module provides functionality for executing token swaps through
 decentralized exchanges with a focus on PYUSD trading pairs.
 """
 
+import asyncio
+import functools
 import logging
+import threading
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
+from eth_abi import decode, encode
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import ContractLogicError
 
+from pylot.execution._multicall import (
+    ALLOWANCE_SELECTOR,
+    DECIMALS_SELECTOR,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    get_multicall_client,
+)
 from pylot.execution.base import TransactionExecutor
 from pylot.integrations.gcp import GCPIntegration
 from pylot.routing.optimizer import Route
@@ -20,6 +34,119 @@ from pylot.routing.optimizer import Route
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Seconds prefetched nonces and allowances stay usable by execute_swap
+PREFETCH_TTL = 5
+
+# Token decimals keyed by (chain ID, checksum address), least recently used first;
+# decimals never change, so entries only leave the cache by eviction
+TOKEN_DECIMALS_CACHE_SIZE = 4096
+_token_decimals: "OrderedDict[Tuple[int, str], int]" = OrderedDict()
+# Quotes read decimals in executor threads while async paths read them on the
+# event loop, so every access to _token_decimals holds this lock
+_token_decimals_lock = threading.Lock()
+
+# Router contracts keyed by (chain ID, DEX name), shared by every executor on the chain
+_dex_contracts: Dict[Tuple[int, str], Contract] = {}
+
+# Powers of ten for scaling token amounts by their decimals (ERC-20 decimals fit in 0..36 in practice)
+_POW10 = tuple(10**i for i in range(37))
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, caching the result since the same addresses recur."""
+    return Web3.to_checksum_address(address)
+
+
+def _cached_decimals(key: Tuple[int, str]) -> Optional[int]:
+    """Look up cached token decimals, marking the entry as recently used."""
+    with _token_decimals_lock:
+        decimals = _token_decimals.get(key)
+        if decimals is not None:
+            _token_decimals.move_to_end(key)
+        return decimals
+
+
+def _cache_decimals(key: Tuple[int, str], decimals: int) -> None:
+    """Cache token decimals, evicting the least recently used entry when full."""
+    with _token_decimals_lock:
+        _token_decimals[key] = decimals
+        _token_decimals.move_to_end(key)
+        if len(_token_decimals) > TOKEN_DECIMALS_CACHE_SIZE:
+            _token_decimals.popitem(last=False)
+
+# Minimal router ABIs, built once at import. In a real implementation these
+# would be loaded from a file or API.
+_UNISWAP_V2_ABI = (
+    # getAmountsOut function
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"}
+        ],
+        "name": "getAmountsOut",
+        "outputs": [
+            {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    # swapExactTokensForTokens function
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"}
+        ],
+        "name": "swapExactTokensForTokens",
+        "outputs": [
+            {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+)
+
+_UNISWAP_V3_ABI = (
+    # exactInputSingle function
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "tokenIn", "type": "address"},
+                    {"internalType": "address", "name": "tokenOut", "type": "address"},
+                    {"internalType": "uint24", "name": "fee", "type": "uint24"},
+                    {"internalType": "address", "name": "recipient", "type": "address"},
+                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+                    {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"},
+                    {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
+                ],
+                "internalType": "struct ISwapRouter.ExactInputSingleParams",
+                "name": "params",
+                "type": "tuple"
+            }
+        ],
+        "name": "exactInputSingle",
+        "outputs": [
+            {"internalType": "uint256", "name": "amountOut", "type": "uint256"}
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+)
+
+# Selector of UniswapV2Router.getAmountsOut, for raw eth_call quotes
+_GET_AMOUNTS_OUT_SELECTOR = bytes(Web3.keccak(text="getAmountsOut(uint256,address[])")[:4])
+
+# Add other DEX ABIs as needed
+_ABI_BY_DEX: Mapping[str, Tuple[Dict, ...]] = MappingProxyType({
+    'uniswap_v2': _UNISWAP_V2_ABI,
+    'uniswap_v3': _UNISWAP_V3_ABI,
+})
+
 
 class TokenSwapExecutor(TransactionExecutor):
     """
@@ -37,6 +164,12 @@ class TokenSwapExecutor(TransactionExecutor):
         'curve': '0x8e764bE4288B842791989DB5b8ec067279829809',  # Curve router
     }
     
+    # Router addresses checksummed once at class load
+    _ROUTER_CHECKSUMS = {
+        dex_name: Web3.to_checksum_address(router_address)
+        for dex_name, router_address in DEX_ROUTERS.items()
+    }
+    
     # PYUSD token address (Ethereum mainnet)
     PYUSD_ADDRESS = '0x6c3ea9036406852006290770BEdFcAbA0e23A0e8'
     
@@ -50,6 +183,43 @@ class TokenSwapExecutor(TransactionExecutor):
         'PYUSD': '0x6c3ea9036406852006290770BEdFcAbA0e23A0e8',
     }
     
+    # Common token addresses checksummed once at class load
+    _CHECKSUM_TOKENS = {
+        symbol: Web3.to_checksum_address(address)
+        for symbol, address in COMMON_TOKENS.items()
+    }
+    
+    # Minimal ERC-20 ABI for allowance management and metadata
+    ERC20_ABI = [
+        {
+            "constant": True,
+            "inputs": [
+                {"name": "_owner", "type": "address"},
+                {"name": "_spender", "type": "address"}
+            ],
+            "name": "allowance",
+            "outputs": [{"name": "", "type": "uint256"}],
+            "type": "function"
+        },
+        {
+            "constant": False,
+            "inputs": [
+                {"name": "_spender", "type": "address"},
+                {"name": "_value", "type": "uint256"}
+            ],
+            "name": "approve",
+            "outputs": [{"name": "", "type": "bool"}],
+            "type": "function"
+        },
+        {
+            "constant": True,
+            "inputs": [],
+            "name": "decimals",
+            "outputs": [{"name": "", "type": "uint8"}],
+            "type": "function"
+        }
+    ]
+    
     def __init__(self, web3_provider: Union[Web3, GCPIntegration], wallet_address: str, private_key: Optional[str] = None):
         """
         Initialize the TokenSwapExecutor.
@@ -60,22 +230,59 @@ class TokenSwapExecutor(TransactionExecutor):
             private_key: Optional private key for signing transactions
         """
         super().__init__(web3_provider, wallet_address, private_key)
-        self.dex_contracts = {}
+        # Chain ID reported by the provider, used to key the module-level caches
+        self.network_chain_id: int = self.web3.eth.chain_id
+        self.dex_contracts: Dict[str, Contract] = {}
+        self.token_contracts: Dict[str, Contract] = {}
+        
+        # Prefetched values as (value, monotonic fetch time)
+        self._nonce_cache: Tuple[int, float] = (0, float('-inf'))
+        self._allowance_cache: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        
         self._initialize_dex_contracts()
+        self.multicall = self.web3.eth.contract(
+            address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        # Shared per-provider client that coalesces async reads into aggregate3 calls
+        self._multicall_client = get_multicall_client(self.web3)
         
     def _initialize_dex_contracts(self) -> None:
-        """Initialize DEX router contracts."""
-        for dex_name, router_address in self.DEX_ROUTERS.items():
-            # ABI would typically be loaded from a JSON file or a database
-            # For now, we'll use a minimal ABI for router functions
-            router_abi = self._get_router_abi(dex_name)
-            if router_abi:
-                self.dex_contracts[dex_name] = self.web3.eth.contract(
-                    address=Web3.to_checksum_address(router_address), 
+        """Initialize DEX router contracts, reusing those already built for this chain."""
+        for dex_name, router_address in self._ROUTER_CHECKSUMS.items():
+            # Contracts are keyed by chain so executors on different chains never collide
+            key = (self.network_chain_id, dex_name)
+            router = _dex_contracts.get(key)
+            if router is None:
+                # ABI would typically be loaded from a JSON file or a database
+                # For now, we'll use a minimal ABI for router functions
+                router_abi = self._get_router_abi(dex_name)
+                if not router_abi:
+                    continue
+                router = self.web3.eth.contract(
+                    address=router_address, 
                     abi=router_abi
                 )
+                _dex_contracts[key] = router
+            self.dex_contracts[dex_name] = router
+    
+    def _get_token_contract(self, token_address: str) -> Contract:
+        """
+        Get a memoized ERC-20 contract object for a token.
+        
+        Args:
+            token_address: Checksum address of the token
+            
+        Returns:
+            Contract object for the token
+        """
+        contract = self.token_contracts.get(token_address)
+        if contract is None:
+            contract = self.web3.eth.contract(address=token_address, abi=self.ERC20_ABI)
+            self.token_contracts[token_address] = contract
+        return contract
     
-    def _get_router_abi(self, dex_name: str) -> List[Dict]:
+    def _get_router_abi(self, dex_name: str) -> Tuple[Dict, ...]:
         """
         Get minimal ABI for a DEX router.
         
@@ -83,80 +290,17 @@ class TokenSwapExecutor(TransactionExecutor):
             dex_name: Name of the DEX (uniswap_v2, uniswap_v3, etc.)
             
         Returns:
-            List containing minimal ABI for the DEX router
-        """
-        # In a real implementation, this would load from a file or API
-        # Returning minimal ABIs here for demonstration
-        if dex_name == 'uniswap_v2':
-            return [
-                # getAmountsOut function
-                {
-                    "inputs": [
-                        {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                        {"internalType": "address[]", "name": "path", "type": "address[]"}
-                    ],
-                    "name": "getAmountsOut",
-                    "outputs": [
-                        {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
-                    ],
-                    "stateMutability": "view",
-                    "type": "function"
-                },
-                # swapExactTokensForTokens function
-                {
-                    "inputs": [
-                        {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                        {"internalType": "uint256", "name": "amountOutMin", "type": "uint256"},
-                        {"internalType": "address[]", "name": "path", "type": "address[]"},
-                        {"internalType": "address", "name": "to", "type": "address"},
-                        {"internalType": "uint256", "name": "deadline", "type": "uint256"}
-                    ],
-                    "name": "swapExactTokensForTokens",
-                    "outputs": [
-                        {"internalType": "uint256[]", "name": "amounts", "type": "uint256[]"}
-                    ],
-                    "stateMutability": "nonpayable",
-                    "type": "function"
-                }
-            ]
-        elif dex_name == 'uniswap_v3':
-            return [
-                # exactInputSingle function
-                {
-                    "inputs": [
-                        {
-                            "components": [
-                                {"internalType": "address", "name": "tokenIn", "type": "address"},
-                                {"internalType": "address", "name": "tokenOut", "type": "address"},
-                                {"internalType": "uint24", "name": "fee", "type": "uint24"},
-                                {"internalType": "address", "name": "recipient", "type": "address"},
-                                {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                                {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                                {"internalType": "uint256", "name": "amountOutMinimum", "type": "uint256"},
-                                {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
-                            ],
-                            "internalType": "struct ISwapRouter.ExactInputSingleParams",
-                            "name": "params",
-                            "type": "tuple"
-                        }
-                    ],
-                    "name": "exactInputSingle",
-                    "outputs": [
-                        {"internalType": "uint256", "name": "amountOut", "type": "uint256"}
-                    ],
-                    "stateMutability": "payable",
-                    "type": "function"
-                }
-            ]
-        # Add other DEX ABIs as needed
-        return []
+            Tuple containing minimal ABI for the DEX router
+        """
+        return _ABI_BY_DEX.get(dex_name, ())
 
     def get_price_quote(
         self, 
         source_token: str, 
         target_token: str, 
         amount: Union[int, float, Decimal], 
-        dex: str = 'uniswap_v2'
+        dex: str = 'uniswap_v2',
+        use_multicall: bool = True
     ) -> Dict:
         """
         Get price quote for swapping tokens.
@@ -166,6 +310,8 @@ class TokenSwapExecutor(TransactionExecutor):
             target_token: Address or symbol of the target token
             amount: Amount of source token to swap
             dex: DEX to use for the quote (default: uniswap_v2)
+            use_multicall: Fetch both token decimals in a single Multicall3
+                eth_call instead of one call per token (default: True)
             
         Returns:
             Dict containing quote information
@@ -175,11 +321,16 @@ class TokenSwapExecutor(TransactionExecutor):
         target_address = self._resolve_token_address(target_token)
         
         # Get token decimals
-        source_decimals = self._get_token_decimals(source_address)
-        target_decimals = self._get_token_decimals(target_address)
+        if use_multicall:
+            source_decimals, target_decimals = self._get_token_decimals_batch(
+                [source_address, target_address]
+            )
+        else:
+            source_decimals = self._get_token_decimals(source_address)
+            target_decimals = self._get_token_decimals(target_address)
         
         # Convert amount to wei
-        amount_in_wei = int(Decimal(amount) * (10 ** source_decimals))
+        amount_in_wei = int(Decimal(str(amount)) * _POW10[source_decimals])
         
         try:
             router = self.dex_contracts.get(dex)
@@ -191,7 +342,7 @@ class TokenSwapExecutor(TransactionExecutor):
                 path = [source_address, target_address]
                 
                 # Get amounts out
-                amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
+                amounts = self._get_amounts_out(router.address, amount_in_wei, path)
                 amount_out = amounts[1]
                 
                 # Calculate price impact (simplified)
@@ -202,7 +353,7 @@ class TokenSwapExecutor(TransactionExecutor):
                     'source_token': source_token,
                     'target_token': target_token,
                     'input_amount': amount,
-                    'output_amount': amount_out / (10 ** target_decimals),
+                    'output_amount': amount_out / _POW10[target_decimals],
                     'price_impact': price_impact,
                     'fee': 0.003,  # Uniswap V2 fee
                     'dex': dex,
@@ -216,14 +367,124 @@ class TokenSwapExecutor(TransactionExecutor):
             logger.error(f"Failed to get price quote: {str(e)}")
             raise
     
-    def execute_swap(
+    async def prefetch(self, source_token: str, target_token: str, dex: str = 'uniswap_v2') -> None:
+        """
+        Warm the caches execute_swap reads, while the user is still choosing a swap.
+        
+        Fetches token decimals, the gas price, the wallet nonce and the router
+        allowance concurrently, so a swap started within PREFETCH_TTL seconds
+        needs no round-trips before building its transaction.
+        
+        Args:
+            source_token: Address or symbol of the source token
+            target_token: Address or symbol of the target token
+            dex: DEX the swap will go through (default: uniswap_v2)
+        """
+        loop = asyncio.get_running_loop()
+        source_address = self._resolve_token_address(source_token)
+        target_address = self._resolve_token_address(target_token)
+        
+        # Decimals and allowance reads are coalesced into one aggregate3 call
+        jobs = [
+            self._get_token_decimals_async(source_address),
+            self._get_token_decimals_async(target_address),
+            loop.run_in_executor(None, self._get_gas_price),
+            loop.run_in_executor(None, self._get_nonce, True)
+        ]
+        if source_address != self._CHECKSUM_TOKENS['ETH']:
+            jobs.append(self._get_allowance_async(source_address, self._ROUTER_CHECKSUMS[dex], True))
+        
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Swap prefetch failed: {str(result)}")
+    
+    def _get_nonce(self, refresh: bool = False) -> int:
+        """
+        Get the wallet nonce, reusing a prefetched value while it is fresh.
+        
+        Args:
+            refresh: Always query the network and update the cache
+            
+        Returns:
+            Next nonce for the wallet
+        """
+        nonce, fetched_at = self._nonce_cache
+        now = time.monotonic()
+        if refresh or now - fetched_at >= PREFETCH_TTL:
+            nonce = self.web3.eth.get_transaction_count(self.wallet_address)
+            self._nonce_cache = (nonce, now)
+        return nonce
+    
+    def _get_allowance(self, token_address: str, spender_address: str, refresh: bool = False) -> int:
+        """
+        Get the wallet's allowance for a spender, reusing a prefetched value while it is fresh.
+        
+        Args:
+            token_address: Checksum address of the token
+            spender_address: Checksum address of the spender
+            refresh: Always query the network and update the cache
+            
+        Returns:
+            Current allowance in the token's smallest unit
+        """
+        key = (token_address, spender_address)
+        allowance, fetched_at = self._allowance_cache.get(key, (0, float('-inf')))
+        now = time.monotonic()
+        if refresh or now - fetched_at >= PREFETCH_TTL:
+            token = self._get_token_contract(token_address)
+            allowance = token.functions.allowance(self.wallet_address, spender_address).call()
+            self._allowance_cache[key] = (allowance, now)
+        return allowance
+    
+    async def _get_allowance_async(self, token_address: str, spender_address: str, refresh: bool = False) -> int:
+        """
+        Async variant of _get_allowance that reads through the shared Multicall3 client.
+        
+        Args:
+            token_address: Checksum address of the token
+            spender_address: Checksum address of the spender
+            refresh: Always query the network and update the cache
+            
+        Returns:
+            Current allowance in the token's smallest unit
+        """
+        key = (token_address, spender_address)
+        allowance, fetched_at = self._allowance_cache.get(key, (0, float('-inf')))
+        if refresh or time.monotonic() - fetched_at >= PREFETCH_TTL:
+            data = ALLOWANCE_SELECTOR + encode(['address', 'address'], [self.wallet_address, spender_address])
+            return_data = await self._multicall_client.call(token_address, data)
+            allowance = decode(['uint256'], return_data)[0]
+            self._allowance_cache[key] = (allowance, time.monotonic())
+        return allowance
+    
+    async def _ensure_token_allowance_async(self, token_address: str, spender_address: str, amount: int) -> bool:
+        """
+        Check the allowance through the shared Multicall3 client and approve only if needed.
+        
+        Args:
+            token_address: Address of the token to be spent
+            spender_address: Checksum address of the DEX router
+            amount: Required allowance in the token's smallest unit
+            
+        Returns:
+            True if an approval transaction was sent
+        """
+        if await self._get_allowance_async(token_address, spender_address) >= amount:
+            return False
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._ensure_token_allowance, token_address, spender_address, amount
+        )
+    
+    async def execute_swap(
         self, 
         route: Route, 
         source_token: str, 
         target_token: str, 
         amount: Union[int, float, Decimal], 
         slippage_tolerance: float = 0.005,
-        deadline_minutes: int = 20
+        deadline_minutes: int = 20,
+        slippage_bps: Optional[int] = None
     ) -> Dict:
         """
         Execute a token swap through a specified DEX.
@@ -233,32 +494,51 @@ class TokenSwapExecutor(TransactionExecutor):
             source_token: Address or symbol of source token
             target_token: Address or symbol of target token
             amount: Amount of source token to swap
-            slippage_tolerance: Maximum acceptable slippage (default: 0.5%)
+            slippage_tolerance: Maximum acceptable slippage (default: 0.5%).
+                Deprecated in favour of slippage_bps.
             deadline_minutes: Transaction deadline in minutes (default: 20)
+            slippage_bps: Maximum acceptable slippage in basis points; takes
+                precedence over slippage_tolerance when given
             
         Returns:
             Dict containing transaction details
         """
+        loop = asyncio.get_running_loop()
+        
         # Resolve token addresses
         source_address = self._resolve_token_address(source_token)
         target_address = self._resolve_token_address(target_token)
         
         # Get token information
-        source_decimals = self._get_token_decimals(source_address)
-        target_decimals = self._get_token_decimals(target_address)
+        source_decimals = await self._get_token_decimals_async(source_address)
         
         # Convert amount to wei
-        amount_in_wei = int(Decimal(amount) * (10 ** source_decimals))
+        amount_in_wei = int(Decimal(str(amount)) * _POW10[source_decimals])
         
-        # Check and set allowance if needed
-        if source_token != 'ETH':
-            self._ensure_token_allowance(source_address, self.DEX_ROUTERS[route.dex], amount_in_wei)
+        async def approve_then_read_nonce() -> int:
+            # The nonce is read only once any approval has been mined, so it
+            # already counts the approval transaction
+            approval_sent = False
+            if source_token != 'ETH':
+                approval_sent = await self._ensure_token_allowance_async(
+                    source_address, self._ROUTER_CHECKSUMS[route.dex], amount_in_wei
+                )
+            return await loop.run_in_executor(None, self._get_nonce, approval_sent)
         
-        # Get price quote
-        quote = self.get_price_quote(source_token, target_token, amount, route.dex)
+        # The price quote and gas price have no data dependencies on the
+        # allowance and nonce, so their RPCs run concurrently with them
+        nonce, quote, gas_price = await asyncio.gather(
+            approve_then_read_nonce(),
+            loop.run_in_executor(
+                None, self.get_price_quote, source_token, target_token, amount, route.dex
+            ),
+            loop.run_in_executor(None, self._get_gas_price)
+        )
         
         # Calculate minimum output amount with slippage protection
-        min_output = int(quote['raw_amount_out'] * (1 - slippage_tolerance))
+        if slippage_bps is None:
+            slippage_bps = round(slippage_tolerance * 10_000)
+        min_output = quote['raw_amount_out'] * (10_000 - slippage_bps) // 10_000
         
         # Set deadline
         deadline = self._get_deadline(deadline_minutes)
@@ -276,26 +556,34 @@ class TokenSwapExecutor(TransactionExecutor):
                 path = [source_address, target_address]
                 
                 # Prepare transaction
-                tx = router.functions.swapExactTokensForTokens(
+                tx_function = router.functions.swapExactTokensForTokens(
                     amount_in_wei,
                     min_output,
                     path,
                     self.wallet_address,
                     deadline
-                ).build_transaction({
+                )
+                tx_params = {
                     'from': self.wallet_address,
                     'gas': 250000,  # Gas limit, would be estimated in a real implementation
-                    'nonce': self.web3.eth.get_transaction_count(self.wallet_address),
-                    'gasPrice': self.web3.eth.gas_price
-                })
+                    'nonce': nonce,
+                    'gasPrice': gas_price
+                }
                 
-                # Sign and send transaction
-                signed_tx = self.web3.eth.account.sign_transaction(tx, self.private_key)
-                tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+                # Build, sign and send off the event loop
+                tx_hash = await loop.run_in_executor(
+                    None, self._sign_and_send, tx_function, tx_params
+                )
+                
+                # The swap used the nonce and spent the allowance, so drop both
+                self._nonce_cache = (0, float('-inf'))
+                self._allowance_cache.pop((source_address, self._ROUTER_CHECKSUMS[route.dex]), None)
             
             # Wait for transaction to be mined
             if tx_hash:
-                receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+                receipt = await loop.run_in_executor(
+                    None, self.web3.eth.wait_for_transaction_receipt, tx_hash, 300
+                )
                 
                 # Check transaction status
                 if receipt['status'] == 1:
@@ -328,7 +616,175 @@ class TokenSwapExecutor(TransactionExecutor):
                 'error': str(e)
             }
     
-    def _ensure_token_allowance(self, token_address: str, spender_address: str, amount: int) -> None:
+    def execute_swap_sync(self, *args, **kwargs) -> Dict:
         """
-        Ensure the router has allowance to spend tokens
-
+        Run execute_swap to completion from synchronous code.
+        
+        Takes the same arguments as execute_swap. Must not be called from a
+        running event loop; await execute_swap there instead.
+        """
+        return asyncio.run(self.execute_swap(*args, **kwargs))
+    
+    def _sign_and_send(self, tx_function, tx_params: Dict) -> bytes:
+        """
+        Build, sign and broadcast a contract function transaction.
+        
+        Args:
+            tx_function: Bound contract function to call
+            tx_params: Transaction parameters, including nonce and gas price
+            
+        Returns:
+            Hash of the sent transaction
+        """
+        tx = tx_function.build_transaction(tx_params)
+        signed_tx = self.web3.eth.account.sign_transaction(tx, self.private_key)
+        return self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    
+    def _ensure_token_allowance(self, token_address: str, spender_address: str, amount: int) -> bool:
+        """
+        Ensure the router has allowance to spend tokens on behalf of the wallet.
+        
+        Args:
+            token_address: Address of the token to be spent
+            spender_address: Checksum address of the DEX router
+            amount: Required allowance in the token's smallest unit
+            
+        Returns:
+            True if an approval transaction was sent, False if the existing
+            allowance was already sufficient
+        """
+        if self._get_allowance(token_address, spender_address) >= amount:
+            return False
+        
+        token = self._get_token_contract(token_address)
+        tx = token.functions.approve(spender_address, amount).build_transaction({
+            'from': self.wallet_address,
+            'nonce': self.web3.eth.get_transaction_count(self.wallet_address),
+            'gasPrice': self.web3.eth.gas_price
+        })
+        signed_tx = self.web3.eth.account.sign_transaction(tx, self.private_key)
+        tx_hash = self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        
+        if receipt['status'] != 1:
+            raise ValueError(f"Token approval failed: {self.web3.to_hex(tx_hash)}")
+        self._allowance_cache[(token_address, spender_address)] = (amount, time.monotonic())
+        logger.info(f"Approved {spender_address} to spend {amount} of {token_address}")
+        return True
+    
+    def _resolve_token_address(self, token: str) -> str:
+        """
+        Resolve a token symbol or address to a checksum address.
+        
+        Args:
+            token: Token symbol (e.g. USDC) or address
+            
+        Returns:
+            Checksum address of the token
+        """
+        address = self._CHECKSUM_TOKENS.get(token.upper())
+        if address is None:
+            address = _checksum(token)
+        return address
+    
+    def _get_token_decimals(self, token_address: str) -> int:
+        """
+        Get the number of decimals used by a token.
+        
+        Results are cached per (chain ID, address), so each token is only
+        queried once while it stays in the cache.
+        
+        Args:
+            token_address: Address of the token
+            
+        Returns:
+            Number of decimals (18 for native ETH)
+        """
+        if token_address == self.COMMON_TOKENS['ETH']:
+            return 18
+        key = (self.network_chain_id, token_address)
+        decimals = _cached_decimals(key)
+        if decimals is None:
+            decimals = self._get_token_contract(token_address).functions.decimals().call()
+            _cache_decimals(key, decimals)
+        return decimals
+    
+    def _get_amounts_out(self, router_address: str, amount_in: int, path: List[str]) -> List[int]:
+        """
+        Call getAmountsOut on a Uniswap V2 style router with a raw eth_call.
+        
+        The calldata is encoded directly from the precomputed selector, which
+        skips web3's contract function lookup and argument validation.
+        
+        Args:
+            router_address: Checksum address of the router
+            amount_in: Input amount in the source token's smallest unit
+            path: Token addresses of the swap path
+            
+        Returns:
+            Output amounts for each hop of the path
+        """
+        data = _GET_AMOUNTS_OUT_SELECTOR + encode(['uint256', 'address[]'], [amount_in, path])
+        result = self.web3.eth.call({'to': router_address, 'data': data})
+        return list(decode(['uint256[]'], result)[0])
+    
+    async def _get_token_decimals_async(self, token_address: str) -> int:
+        """
+        Async variant of _get_token_decimals that reads through the shared Multicall3 client.
+        
+        Args:
+            token_address: Address of the token
+            
+        Returns:
+            Number of decimals (18 for native ETH)
+        """
+        if token_address == self._CHECKSUM_TOKENS['ETH']:
+            return 18
+        key = (self.network_chain_id, token_address)
+        decimals = _cached_decimals(key)
+        if decimals is None:
+            return_data = await self._multicall_client.call(token_address, DECIMALS_SELECTOR)
+            decimals = decode(['uint8'], return_data)[0]
+            _cache_decimals(key, decimals)
+        return decimals
+    
+    def _get_token_decimals_batch(self, token_addresses: List[str]) -> List[int]:
+        """
+        Get the decimals of several tokens with a single Multicall3 eth_call.
+        
+        Only tokens missing from the decimals cache are queried, and no call
+        is made at all when every token is already cached.
+        
+        Args:
+            token_addresses: Addresses of the tokens
+            
+        Returns:
+            Number of decimals for each token, in the same order
+        """
+        eth_address = self.COMMON_TOKENS['ETH']
+        # Resolved here rather than read back from the cache, which may evict entries
+        decimals: Dict[str, Optional[int]] = {eth_address: 18}
+        for address in token_addresses:
+            if address not in decimals:
+                decimals[address] = _cached_decimals((self.network_chain_id, address))
+        missing = [address for address, value in decimals.items() if value is None]
+        if missing:
+            calls = [(address, False, DECIMALS_SELECTOR) for address in missing]
+            results = self.multicall.functions.aggregate3(calls).call()
+            for address, (_, return_data) in zip(missing, results):
+                decimals[address] = self.web3.codec.decode(['uint8'], return_data)[0]
+                _cache_decimals((self.network_chain_id, address), decimals[address])
+        
+        return [decimals[address] for address in token_addresses]
+    
+    def _get_deadline(self, minutes: int) -> int:
+        """
+        Get a swap deadline as a unix timestamp.
+        
+        Args:
+            minutes: Minutes from now until the deadline
+            
+        Returns:
+            Deadline timestamp in seconds
+        """
+        return int(time.time()) + minutes * 60
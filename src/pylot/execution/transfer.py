@@ -6,17 +6,73 @@ within the same blockchain. It extends the base TransactionExecutor class
 and implements methods for token approvals, transfers, and balance checks.
 """
 
+import asyncio
+import functools
+import json
+import os
+import re
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
+from eth_abi import encode
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError, ValidationError
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, ValidationError
 from web3.types import TxParams, TxReceipt, Wei
 
+from pylot.execution._multicall import (
+    ALLOWANCE_SELECTOR,
+    BALANCE_OF_SELECTOR,
+    DECIMALS_SELECTOR,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+)
 from pylot.execution.base import TransactionExecutor
 from pylot.integrations.gcp import GCPIntegration
 
+# On-disk cache of token decimals, so they survive restarts
+DECIMALS_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "pylot",
+    "token_decimals.json"
+)
+
+# Maximum number of token contract instances kept per executor
+TOKEN_CONTRACT_CACHE_SIZE = 512
+
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# Seconds a read allowance is reused for transferFrom pre-flight checks
+ALLOWANCE_TTL = 5
+
+
+
+def _decode_uint(return_data: bytes) -> int:
+    """Decode a single uint return value without going through eth_abi."""
+    if len(return_data) < 32:
+        raise BadFunctionCallOutput(f"Expected a uint return value, got {len(return_data)} bytes")
+    return int.from_bytes(return_data[:32], "big")
+
+
+def _token_key(token_address: str) -> str:
+    """
+    Normalize a token address for use as a cache key.
+    
+    Raises:
+        ValueError: If the address is not a 20-byte hex string
+    """
+    if not isinstance(token_address, str) or not _ADDRESS_RE.fullmatch(token_address):
+        raise ValueError(f"Invalid token address: {token_address!r}")
+    return token_address.lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, caching the result since the same addresses recur."""
+    return Web3.to_checksum_address(address)
+
 
 class TokenTransferExecutor(TransactionExecutor):
     """
@@ -94,7 +150,21 @@ class TokenTransferExecutor(TransactionExecutor):
             chain_id: Chain ID of the blockchain network
         """
         super().__init__(web3_provider, chain_id)
-        self.token_contracts: Dict[str, Contract] = {}
+        # Keyed by lowercase address; least recently used contracts are evicted
+        # beyond TOKEN_CONTRACT_CACHE_SIZE
+        self.token_contracts: "OrderedDict[str, Contract]" = OrderedDict()
+        self._multicall_contract: Optional[Contract] = None
+        # Contract class built from ERC20_ABI once, then bound to each token address
+        self._erc20_factory: Optional[Type[Contract]] = None
+        
+        # Token decimals never change, so they are fetched once per token;
+        # this and the scale cache are keyed by lowercase address
+        self._decimals_cache: Dict[str, int] = self._load_decimals_cache()
+        # 10 ** decimals per token, for converting human-readable amounts
+        self._scale_cache: Dict[str, int] = {}
+        # Last read allowances as (raw allowance, monotonic read time), keyed by
+        # (token, owner, spender)
+        self._allowance_cache: Dict[Tuple[str, str, str], Tuple[int, float]] = {}
         
     def get_token_contract(self, token_address: str) -> Contract:
         """
@@ -106,18 +176,163 @@ class TokenTransferExecutor(TransactionExecutor):
         Returns:
             Contract instance for the token
         """
-        if token_address not in self.token_contracts:
-            if isinstance(self.provider, GCPIntegration):
-                web3 = self.provider.get_web3_instance()
-            else:
-                web3 = self.provider
-                
-            self.token_contracts[token_address] = web3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=self.ERC20_ABI
+        key = _token_key(token_address)
+        contract = self.token_contracts.get(key)
+        if contract is not None:
+            self.token_contracts.move_to_end(key)
+            return contract
+        
+        if self._erc20_factory is None:
+            self._erc20_factory = self._get_web3().eth.contract(abi=self.ERC20_ABI)
+        contract = self._erc20_factory(address=_checksum(token_address))
+        self.token_contracts[key] = contract
+        if len(self.token_contracts) > TOKEN_CONTRACT_CACHE_SIZE:
+            evicted, _ = self.token_contracts.popitem(last=False)
+            self.logger.debug(f"Evicted token contract {evicted} from cache")
+        
+        return contract
+    
+    def _get_web3(self) -> Web3:
+        """Get the Web3 instance behind the configured provider."""
+        if isinstance(self.provider, GCPIntegration):
+            return self.provider.get_web3_instance()
+        return self.provider
+    
+    def _multicall(self, calls: List[Tuple[str, bytes]]) -> List[bytes]:
+        """
+        Execute several read calls in a single Multicall3 eth_call.
+        
+        Args:
+            calls: (target address, calldata) pairs
+            
+        Returns:
+            Raw return data of each call, in order
+        """
+        if self._multicall_contract is None:
+            self._multicall_contract = self._get_web3().eth.contract(
+                address=_checksum(MULTICALL3_ADDRESS),
+                abi=MULTICALL3_ABI
             )
+        results = self._multicall_contract.functions.aggregate3(
+            [(target, False, data) for target, data in calls]
+        ).call()
+        return [return_data for _, return_data in results]
+    
+    def _read_with_decimals(self, token_address: str, data: bytes) -> Tuple[int, int]:
+        """
+        Read a uint256 from a token together with its decimals.
+        
+        When the decimals are not cached yet, both reads share one Multicall3
+        eth_call instead of taking two sequential round-trips.
+        
+        Args:
+            token_address: Address of the ERC-20 token
+            data: Calldata of a view function returning a uint256
+            
+        Returns:
+            Tuple of (value, decimals)
+        """
+        key = _token_key(token_address)
+        token_address_cs = _checksum(token_address)
+        decimals = self._decimals_cache.get(key)
+        if decimals is not None:
+            return_data = self._get_web3().eth.call({"to": token_address_cs, "data": data})
+            return _decode_uint(return_data), decimals
         
-        return self.token_contracts[token_address]
+        value_data, decimals_data = self._multicall([
+            (token_address_cs, data),
+            (token_address_cs, DECIMALS_SELECTOR)
+        ])
+        decimals = _decode_uint(decimals_data)
+        self._decimals_cache[key] = decimals
+        self._save_decimals_cache()
+        return _decode_uint(value_data), decimals
+    
+    def _get_decimals(self, token_address: str) -> int:
+        """
+        Get the decimals of a token, querying the chain only the first time.
+        
+        Args:
+            token_address: Address of the ERC-20 token
+            
+        Returns:
+            Number of decimals used by the token
+        """
+        key = _token_key(token_address)
+        decimals = self._decimals_cache.get(key)
+        if decimals is None:
+            return_data = self._get_web3().eth.call(
+                {"to": _checksum(token_address), "data": DECIMALS_SELECTOR}
+            )
+            try:
+                decimals = _decode_uint(return_data)
+            except BadFunctionCallOutput:
+                # Non-standard token; let the contract path deal with it
+                decimals = self.get_token_contract(token_address).functions.decimals().call()
+            self._decimals_cache[key] = decimals
+            self._save_decimals_cache()
+        return decimals
+    
+    def _to_raw(self, amount: Union[int, Decimal, str], token_address: str) -> int:
+        """
+        Convert an amount to the token's raw integer units.
+        
+        Ints are taken as raw amounts already. Whole-number strings are scaled
+        with integer arithmetic; only fractional amounts go through Decimal.
+        
+        Args:
+            amount: Raw int amount, or human-readable Decimal or string amount
+            token_address: Address of the token
+            
+        Returns:
+            Raw token amount
+        """
+        if isinstance(amount, int):
+            return amount
+        
+        key = _token_key(token_address)
+        scale = self._scale_cache.get(key)
+        if scale is None:
+            scale = 10 ** self._get_decimals(token_address)
+            self._scale_cache[key] = scale
+        
+        if isinstance(amount, str):
+            if amount.isdigit():
+                return int(amount) * scale
+            amount = Decimal(amount)
+        return int(amount * scale)
+    
+    def _load_decimals_cache(self) -> Dict[str, int]:
+        """
+        Load this chain's cached token decimals from disk.
+        
+        Returns:
+            Decimals keyed by lowercase token address, empty if there is no usable cache
+        """
+        try:
+            with open(DECIMALS_CACHE_PATH) as f:
+                cached = json.load(f).get(str(self.chain_id), {})
+            return {address.lower(): decimals for address, decimals in cached.items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _save_decimals_cache(self) -> None:
+        """Write this chain's token decimals to the on-disk cache."""
+        try:
+            try:
+                with open(DECIMALS_CACHE_PATH) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            data[str(self.chain_id)] = self._decimals_cache
+            
+            os.makedirs(os.path.dirname(DECIMALS_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{DECIMALS_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, DECIMALS_CACHE_PATH)
+        except OSError as e:
+            self.logger.warning(f"Failed to save token decimals cache: {str(e)}")
     
     def get_token_balance(self, token_address: str, owner_address: str) -> Tuple[Decimal, int]:
         """
@@ -130,14 +345,11 @@ class TokenTransferExecutor(TransactionExecutor):
         Returns:
             Tuple of (human_readable_balance, raw_balance)
         """
-        token_contract = self.get_token_contract(token_address)
-        
         try:
-            raw_balance = token_contract.functions.balanceOf(
-                Web3.to_checksum_address(owner_address)
-            ).call()
-            
-            decimals = token_contract.functions.decimals().call()
+            raw_balance, decimals = self._read_with_decimals(
+                token_address,
+                BALANCE_OF_SELECTOR + encode(["address"], [_checksum(owner_address)])
+            )
             human_readable = Decimal(raw_balance) / Decimal(10 ** decimals)
             
             return human_readable, raw_balance
@@ -159,15 +371,19 @@ class TokenTransferExecutor(TransactionExecutor):
         Returns:
             Tuple of (human_readable_allowance, raw_allowance)
         """
-        token_contract = self.get_token_contract(token_address)
-        
+        owner_address = _checksum(owner_address)
+        spender_address = _checksum(spender_address)
         try:
-            raw_allowance = token_contract.functions.allowance(
-                Web3.to_checksum_address(owner_address),
-                Web3.to_checksum_address(spender_address)
-            ).call()
-            
-            decimals = token_contract.functions.decimals().call()
+            raw_allowance, decimals = self._read_with_decimals(
+                token_address,
+                ALLOWANCE_SELECTOR + encode(
+                    ["address", "address"],
+                    [owner_address, spender_address]
+                )
+            )
+            self._allowance_cache[(_checksum(token_address), owner_address, spender_address)] = (
+                raw_allowance, time.monotonic()
+            )
             human_readable = Decimal(raw_allowance) / Decimal(10 ** decimals)
             
             return human_readable, raw_allowance
@@ -175,6 +391,24 @@ class TokenTransferExecutor(TransactionExecutor):
             self.logger.error(f"Failed to check token allowance: {str(e)}")
             raise
     
+    async def check_allowance_async(
+        self, token_address: str, owner_address: str, spender_address: str
+    ) -> Tuple[Decimal, int]:
+        """
+        Async variant of check_allowance, run on the default executor.
+        
+        Args:
+            token_address: Address of the ERC-20 token
+            owner_address: Address of the token owner
+            spender_address: Address of the spender to check allowance for
+            
+        Returns:
+            Tuple of (human_readable_allowance, raw_allowance)
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.check_allowance, token_address, owner_address, spender_address
+        )
+    
     def approve_token_spending(
         self,
         token_address: str,
@@ -205,17 +439,11 @@ class TokenTransferExecutor(TransactionExecutor):
             Transaction receipt
         """
         token_contract = self.get_token_contract(token_address)
-        sender_address = Web3.to_checksum_address(sender_address)
-        spender_address = Web3.to_checksum_address(spender_address)
+        sender_address = _checksum(sender_address)
+        spender_address = _checksum(spender_address)
         
         # Convert human-readable amount to raw amount if necessary
-        if isinstance(amount, (Decimal, str)):
-            decimals = token_contract.functions.decimals().call()
-            if isinstance(amount, str):
-                amount = Decimal(amount)
-            raw_amount = int(amount * Decimal(10 ** decimals))
-        else:
-            raw_amount = amount
+        raw_amount = self._to_raw(amount, token_address)
         
         # Prepare transaction parameters
         tx_params = self._prepare_transaction_params(
@@ -233,11 +461,16 @@ class TokenTransferExecutor(TransactionExecutor):
         ).build_transaction(tx_params)
         
         # Execute the transaction
-        return self._execute_transaction(
+        receipt = self._execute_transaction(
             transaction=approve_tx,
             private_key=private_key,
             sender_address=sender_address
         )
+        if receipt.get("status") == 1:
+            self._allowance_cache[(_checksum(token_address), sender_address, spender_address)] = (
+                raw_amount, time.monotonic()
+            )
+        return receipt
     
     def transfer_tokens(
         self,
@@ -269,17 +502,11 @@ class TokenTransferExecutor(TransactionExecutor):
             Transaction receipt
         """
         token_contract = self.get_token_contract(token_address)
-        sender_address = Web3.to_checksum_address(sender_address)
-        recipient_address = Web3.to_checksum_address(recipient_address)
+        sender_address = _checksum(sender_address)
+        recipient_address = _checksum(recipient_address)
         
         # Convert human-readable amount to raw amount if necessary
-        if isinstance(amount, (Decimal, str)):
-            decimals = token_contract.functions.decimals().call()
-            if isinstance(amount, str):
-                amount = Decimal(amount)
-            raw_amount = int(amount * Decimal(10 ** decimals))
-        else:
-            raw_amount = amount
+        raw_amount = self._to_raw(amount, token_address)
         
         # Prepare transaction parameters
         tx_params = self._prepare_transaction_params(
@@ -314,7 +541,8 @@ class TokenTransferExecutor(TransactionExecutor):
         gas_limit: Optional[int] = None,
         gas_price: Optional[Wei] = None,
         max_priority_fee: Optional[Wei] = None,
-        nonce: Optional[int] = None
+        nonce: Optional[int] = None,
+        skip_allowance_check: bool = False
     ) -> TxReceipt:
         """
         Transfer tokens from one address to another using the sender's allowance.
@@ -330,30 +558,34 @@ class TokenTransferExecutor(TransactionExecutor):
             gas_price: Optional custom gas price
             max_priority_fee: Optional max priority fee for EIP-1559 transactions
             nonce: Optional custom nonce for the transaction
+            skip_allowance_check: Don't check the allowance before sending; the
+                token contract still enforces it on-chain
             
         Returns:
             Transaction receipt
         """
         token_contract = self.get_token_contract(token_address)
-        sender_address = Web3.to_checksum_address(sender_address)
-        from_address = Web3.to_checksum_address(from_address)
-        to_address = Web3.to_checksum_address(to_address)
+        sender_address = _checksum(sender_address)
+        from_address = _checksum(from_address)
+        to_address = _checksum(to_address)
+        allowance_key = (_checksum(token_address), from_address, sender_address)
         
-        # Convert human-readable amount to raw amount if necessary
-        if isinstance(amount, (Decimal, str)):
-            decimals = token_contract.functions.decimals().call()
-            if isinstance(amount, str):
-                amount = Decimal(amount)
-            raw_amount = int(amount * Decimal(10 ** decimals))
+        if skip_allowance_check:
+            raw_amount = self._to_raw(amount, token_address)
         else:
-            raw_amount = amount
-        
-        # Check allowance
-        _, allowance = self.check_allowance(token_address, from_address, sender_address)
-        if allowance < raw_amount:
-            raise ValueError(
-                f"Insufficient allowance. Current: {allowance}, Required: {raw_amount}"
-            )
+            # Reuse a recently read allowance; otherwise read it together with decimals
+            allowance, read_at = self._allowance_cache.get(allowance_key, (0, float('-inf')))
+            if time.monotonic() - read_at >= ALLOWANCE_TTL:
+                _, allowance = self.check_allowance(token_address, from_address, sender_address)
+            
+            # Convert human-readable amount to raw amount if necessary
+            raw_amount = self._to_raw(amount, token_address)
+            
+            # Check allowance
+            if allowance < raw_amount:
+                raise ValueError(
+                    f"Insufficient allowance. Current: {allowance}, Required: {raw_amount}"
+                )
         
         # Prepare transaction parameters
         tx_params = self._prepare_transaction_params(
@@ -372,9 +604,106 @@ class TokenTransferExecutor(TransactionExecutor):
         ).build_transaction(tx_params)
         
         # Execute the transaction
-        return self._execute_transaction(
+        receipt = self._execute_transaction(
             transaction=transfer_from_tx,
             private_key=private_key,
             sender_address=sender_address
         )
-
+        # The transfer spent (part of) the allowance, so the cached value is stale
+        self._allowance_cache.pop(allowance_key, None)
+        return receipt
+    
+    async def transfer_tokens_from_async(
+        self,
+        token_address: str,
+        from_address: str,
+        to_address: str,
+        amount: Union[int, Decimal, str],
+        sender_address: str,
+        private_key: Optional[str] = None,
+        gas_limit: Optional[int] = None,
+        gas_price: Optional[Wei] = None,
+        max_priority_fee: Optional[Wei] = None,
+        nonce: Optional[int] = None,
+        skip_allowance_check: bool = False
+    ) -> TxReceipt:
+        """
+        Async variant of transfer_tokens_from.
+        
+        The allowance read and the transaction parameter reads (nonce, gas
+        price) are independent, so they run concurrently instead of one after
+        the other.
+        
+        Args:
+            token_address: Address of the ERC-20 token
+            from_address: Address to transfer tokens from
+            to_address: Address to transfer tokens to
+            amount: Amount to transfer (can be human readable or raw)
+            sender_address: Address executing the transfer (must have allowance)
+            private_key: Private key for transaction signing (if not using personal accounts)
+            gas_limit: Optional custom gas limit
+            gas_price: Optional custom gas price
+            max_priority_fee: Optional max priority fee for EIP-1559 transactions
+            nonce: Optional custom nonce for the transaction
+            skip_allowance_check: Don't check the allowance before sending; the
+                token contract still enforces it on-chain
+            
+        Returns:
+            Transaction receipt
+        """
+        loop = asyncio.get_running_loop()
+        token_contract = self.get_token_contract(token_address)
+        sender_address = _checksum(sender_address)
+        from_address = _checksum(from_address)
+        to_address = _checksum(to_address)
+        allowance_key = (_checksum(token_address), from_address, sender_address)
+        
+        prepare_params = loop.run_in_executor(None, functools.partial(
+            self._prepare_transaction_params,
+            sender_address=sender_address,
+            gas_limit=gas_limit,
+            gas_price=gas_price,
+            max_priority_fee=max_priority_fee,
+            nonce=nonce
+        ))
+        
+        allowance, read_at = self._allowance_cache.get(allowance_key, (0, float('-inf')))
+        if skip_allowance_check or time.monotonic() - read_at < ALLOWANCE_TTL:
+            tx_params = await prepare_params
+        else:
+            # Read the allowance (and decimals) while the parameters are prepared
+            try:
+                (_, allowance), tx_params = await asyncio.gather(
+                    self.check_allowance_async(token_address, from_address, sender_address),
+                    prepare_params
+                )
+            except Exception:
+                prepare_params.cancel()
+                raise
+        
+        # Convert human-readable amount to raw amount if necessary
+        raw_amount = self._to_raw(amount, token_address)
+        
+        # Check allowance
+        if not skip_allowance_check and allowance < raw_amount:
+            raise ValueError(
+                f"Insufficient allowance. Current: {allowance}, Required: {raw_amount}"
+            )
+        
+        # Build the transferFrom transaction
+        transfer_from_tx = token_contract.functions.transferFrom(
+            from_address,
+            to_address,
+            raw_amount
+        ).build_transaction(tx_params)
+        
+        # Execute the transaction
+        receipt = await loop.run_in_executor(None, functools.partial(
+            self._execute_transaction,
+            transaction=transfer_from_tx,
+            private_key=private_key,
+            sender_address=sender_address
+        ))
+        # The transfer spent (part of) the allowance, so the cached value is stale
+        self._allowance_cache.pop(allowance_key, None)
+        return receipt
@@ -5,18 +5,85 @@ This module provides classes and utilities for interacting with Google Cloud's
 Blockchain RPC services, specifically optimized for Ethereum networks.
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
 import time
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
+import aiohttp
+import orjson
 import requests
-from web3 import Web3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import AsyncWeb3, Web3
+from web3.contract import Contract
 from web3.exceptions import BadFunctionCallOutput, TransactionNotFound
-from web3.middleware import geth_poa_middleware
+from web3.middleware import async_geth_poa_middleware, geth_poa_middleware
+
+from pylot.rpc_session import OrjsonAsyncHTTPProvider, get_session, use_shared_session
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared RPC session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Retry policy for the shared RPC session. JSON-RPC goes over POST, so POST is
+# allowed, but only for failures where the node never saw the request: a
+# request that reached it (e.g. eth_sendRawTransaction) must not be sent twice.
+# Read errors are never retried, and neither are 502/503/504, since a gateway
+# returns those after it may already have forwarded the request. A 429 is a
+# rejection, so it is retried (honouring Retry-After).
+RPC_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    backoff_factor=0.2,
+    status_forcelist=(429,),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+
+# Contract instances kept per integration for execute_contract_function
+CONTRACT_CACHE_SIZE = 512
+# Transactions and receipts kept per integration once they are final
+TX_CACHE_SIZE = 2048
+# Confirmations after which a transaction is treated as final (safe from reorgs)
+FINALITY_CONFIRMATIONS = 64
+# Seconds the chain tip is reused for finality checks
+TIP_TTL = 2
+
+_session: Optional[requests.Session] = None
+
+
+def get_rpc_session() -> requests.Session:
+    """
+    Get the process-wide keep-alive session used for RPC traffic.
+    
+    Sharing one pooled session lets every provider and custom RPC call reuse
+    open connections instead of doing a TCP and TLS handshake per request.
+    
+    Returns:
+        The shared requests Session
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RPC_RETRY
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+    return _session
+
+
 class GCPRPCError(Exception):
     """Custom exception for GCP RPC-related errors."""
     pass
@@ -33,10 +100,15 @@ class GCPIntegration:
     MAINNET_RPC_URL = "https://eth.blockchain-data.googleapis.com"
     HOLESKY_RPC_URL = "https://eth-holesky.blockchain-data.googleapis.com"
     
+    RPC_HEADERS = {
+        "Content-Type": "application/json"
+    }
+    
     def __init__(self, 
                  network: str = "mainnet", 
                  api_key: Optional[str] = None,
-                 timeout: int = 60):
+                 timeout: int = 60,
+                 chain_rpc_urls: Optional[Dict[str, str]] = None):
         """
         Initialize the GCP Blockchain RPC integration.
         
@@ -44,6 +116,8 @@ class GCPIntegration:
             network: The Ethereum network to connect to ("mainnet" or "holesky")
             api_key: Optional API key for GCP services (if required)
             timeout: Request timeout in seconds
+            chain_rpc_urls: Optional RPC URLs for chains other than Ethereum,
+                keyed by chain name (e.g. "arbitrum")
         """
         self.network = network.lower()
         self.api_key = api_key
@@ -63,15 +137,87 @@ class GCPIntegration:
         if self.api_key:
             self.rpc_url = f"{self.rpc_url}?key={self.api_key}"
         
-        # Initialize web3 connection
-        self.web3 = Web3(Web3.HTTPProvider(self.rpc_url, request_kwargs={'timeout': self.timeout}))
+        # Keep-alive session shared by raw RPC calls and the web3 provider;
+        # the Web3 instance itself is created on first use of self.web3
+        self.session = get_rpc_session()
+        
+        # RPC URLs per chain name; Ethereum is served by GCP itself
+        self.chain_rpc_urls = {"ethereum": self.rpc_url, **(chain_rpc_urls or {})}
+        self._async_web3: Dict[str, AsyncWeb3] = {}
+        
+        # Contracts keyed by (address, function name or None, id(abi)), least
+        # recently used first; the ABI is kept alongside so its id cannot be
+        # reused while the entry exists
+        self._contracts: "OrderedDict[Tuple[str, Optional[str], int], Tuple[List[Dict], Contract]]" = OrderedDict()
+        
+        # Final transactions and receipts by lowercase hash, least recently used
+        # first; entries are read-only AttributeDicts, so they are shared as-is
+        self._tx_cache: "OrderedDict[str, Mapping[str, Any]]" = OrderedDict()
+        self._receipt_cache: "OrderedDict[str, Mapping[str, Any]]" = OrderedDict()
+        # JSON-RPC request ids; next() on a count is atomic under the GIL
+        self._id_counter = itertools.count(1)
+        
+        # Chain tip as (block number, monotonic read time)
+        self._tip: Tuple[int, float] = (0, float('-inf'))
+        
+        logger.info(f"Initialized GCP Blockchain RPC integration for {self.network}")
+        
+    @functools.cached_property
+    def web3(self) -> Web3:
+        """
+        Web3 instance for the GCP endpoint, created on first access.
+        
+        Trace-only workloads go through _make_rpc_call and never pay for it.
+        """
+        w3 = Web3(Web3.HTTPProvider(
+            self.rpc_url,
+            request_kwargs={'timeout': self.timeout},
+            session=self.session
+        ))
         
         # Add middleware for POA networks (like Holesky)
         if self.network == "holesky":
-            self.web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+            w3.middleware_onion.inject(geth_poa_middleware, layer=0)
         
-        logger.info(f"Initialized GCP Blockchain RPC integration for {self.network}")
+        return w3
+    
+    def get_web3_instance(self) -> Web3:
+        """Get the Web3 instance for the GCP endpoint."""
+        return self.web3
+    
+    async def get_async_web3(self, chain: str = "ethereum") -> AsyncWeb3:
+        """
+        Get an AsyncWeb3 instance for a chain, creating it on first use.
         
+        The instance's provider sends its requests through the shared aiohttp
+        session, so all async RPC traffic reuses the same connection pool.
+        
+        Args:
+            chain: Chain name ("ethereum" or a key of chain_rpc_urls)
+            
+        Returns:
+            AsyncWeb3 instance connected to the chain
+        """
+        w3 = self._async_web3.get(chain)
+        if w3 is not None:
+            return w3
+        
+        rpc_url = self.chain_rpc_urls.get(chain)
+        if rpc_url is None:
+            raise GCPRPCError(f"No RPC endpoint configured for chain: {chain}")
+        
+        provider = OrjsonAsyncHTTPProvider(
+            rpc_url,
+            request_kwargs={'timeout': aiohttp.ClientTimeout(total=self.timeout)}
+        )
+        await use_shared_session(provider)
+        w3 = AsyncWeb3(provider)
+        if chain == "ethereum" and self.network == "holesky":
+            w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
+        
+        self._async_web3[chain] = w3
+        return w3
+    
     def is_connected(self) -> bool:
         """Check if the connection to the GCP RPC endpoint is working."""
         try:
@@ -105,18 +251,27 @@ class GCPIntegration:
             logger.error(f"Error getting balance for {address}: {str(e)}")
             raise GCPRPCError(f"Failed to get balance for {address}: {str(e)}")
     
-    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
+    def get_transaction(self, tx_hash: str, as_dict: bool = False) -> Mapping[str, Any]:
         """
         Get transaction details by hash.
         
         Args:
             tx_hash: The transaction hash
+            as_dict: Return a mutable dict copy instead of the read-only AttributeDict
             
         Returns:
-            Transaction details as a dictionary
+            Transaction details as a mapping
         """
+        key = self._tx_cache_key(tx_hash)
+        tx = self._cache_get(self._tx_cache, key)
+        if tx is not None:
+            return dict(tx) if as_dict else tx
+        
         try:
-            return dict(self.web3.eth.get_transaction(tx_hash))
+            tx = self.web3.eth.get_transaction(tx_hash)
+            if self._is_final(tx.get("blockNumber")):
+                self._cache_put(self._tx_cache, key, tx)
+            return dict(tx) if as_dict else tx
         except TransactionNotFound:
             logger.error(f"Transaction not found: {tx_hash}")
             raise GCPRPCError(f"Transaction not found: {tx_hash}")
@@ -124,23 +279,79 @@ class GCPIntegration:
             logger.error(f"Error getting transaction {tx_hash}: {str(e)}")
             raise GCPRPCError(f"Failed to get transaction {tx_hash}: {str(e)}")
     
-    def get_transaction_receipt(self, tx_hash: str) -> Dict[str, Any]:
+    def get_transaction_receipt(self, tx_hash: str, as_dict: bool = False) -> Optional[Mapping[str, Any]]:
         """
         Get transaction receipt by hash.
         
         Args:
             tx_hash: The transaction hash
+            as_dict: Return a mutable dict copy instead of the read-only AttributeDict
             
         Returns:
-            Transaction receipt as a dictionary
+            Transaction receipt as a mapping
         """
+        key = self._tx_cache_key(tx_hash)
+        receipt = self._cache_get(self._receipt_cache, key)
+        if receipt is not None:
+            return dict(receipt) if as_dict else receipt
+        
         try:
             receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-            return dict(receipt) if receipt else None
+            if not receipt:
+                return None
+            if "status" in receipt and self._is_final(receipt.get("blockNumber")):
+                self._cache_put(self._receipt_cache, key, receipt)
+            return dict(receipt) if as_dict else receipt
         except Exception as e:
             logger.error(f"Error getting transaction receipt {tx_hash}: {str(e)}")
             raise GCPRPCError(f"Failed to get transaction receipt {tx_hash}: {str(e)}")
     
+    def _is_final(self, block_number: Optional[int]) -> bool:
+        """
+        Check whether a block is at least FINALITY_CONFIRMATIONS behind the tip.
+        
+        The tip is re-read at most every TIP_TTL seconds, and only when the
+        cached tip is not already far enough ahead of the block.
+        
+        Args:
+            block_number: The block to check, or None for a pending transaction
+            
+        Returns:
+            True if the block can no longer be reorged out
+        """
+        if block_number is None:
+            return False
+        
+        tip, read_at = self._tip
+        if tip - block_number >= FINALITY_CONFIRMATIONS:
+            return True
+        
+        now = time.monotonic()
+        if now - read_at >= TIP_TTL:
+            tip = self.get_block_number()
+            self._tip = (tip, now)
+        return tip - block_number >= FINALITY_CONFIRMATIONS
+    
+    @staticmethod
+    def _tx_cache_key(tx_hash: Union[str, bytes]) -> str:
+        """Normalize a transaction hash for use as a cache key."""
+        return Web3.to_hex(tx_hash).lower() if isinstance(tx_hash, bytes) else tx_hash.lower()
+    
+    @staticmethod
+    def _cache_get(cache: "OrderedDict[str, Mapping[str, Any]]", key: str) -> Optional[Mapping[str, Any]]:
+        """Look up an LRU cache entry, marking it as recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: "OrderedDict[str, Mapping[str, Any]]", key: str, value: Mapping[str, Any]) -> None:
+        """Store an LRU cache entry, evicting the oldest beyond TX_CACHE_SIZE."""
+        cache[key] = value
+        if len(cache) > TX_CACHE_SIZE:
+            cache.popitem(last=False)
+    
     def trace_transaction(self, tx_hash: str) -> Dict[str, Any]:
         """
         Execute trace_transaction RPC call.
@@ -171,25 +382,131 @@ class GCPIntegration:
         tracer_options = {"tracer": tracer}
         return self._make_rpc_call("debug_traceTransaction", [tx_hash, tracer_options])
     
-    def trace_block(self, block_number: Union[str, int]) -> List[Dict[str, Any]]:
+    def trace_block(self, 
+                    block_number: Union[str, int], 
+                    per_transaction: bool = False, 
+                    tracer: str = "callTracer") -> List[Dict[str, Any]]:
         """
         Execute trace_block RPC call.
         
         Args:
             block_number: Block number or "latest"
+            per_transaction: Instead of trace_block, debug-trace every transaction
+                in the block, sent as a single JSON-RPC batch
+            tracer: The tracer to use when per_transaction is set (default: "callTracer")
             
         Returns:
             List of traces for all transactions in the block
         """
+        if per_transaction:
+            tx_hashes = self.web3.eth.get_block(block_number)["transactions"]
+            tracer_options = {"tracer": tracer}
+            return self._make_rpc_batch([
+                ("debug_traceTransaction", [Web3.to_hex(tx_hash), tracer_options])
+                for tx_hash in tx_hashes
+            ])
+        
         if isinstance(block_number, int):
             block_number = hex(block_number)
         return self._make_rpc_call("trace_block", [block_number])
     
+    def trace_transactions_parallel(self, 
+                                    tx_hashes: List[str], 
+                                    max_workers: int = 16) -> List[Union[Dict[str, Any], GCPRPCError]]:
+        """
+        Trace several transactions concurrently.
+        
+        Each trace is a separate trace_transaction call run on a thread pool, so
+        the calls wait on the network in parallel instead of one after another.
+        
+        Args:
+            tx_hashes: The transaction hashes to trace
+            max_workers: Maximum number of concurrent RPC calls (default: 16)
+            
+        Returns:
+            Traces in the same order as tx_hashes; a trace that failed is
+            returned as its GCPRPCError instead of failing the whole batch
+        """
+        def trace(tx_hash: str) -> Union[Dict[str, Any], GCPRPCError]:
+            try:
+                return self.trace_transaction(tx_hash)
+            except GCPRPCError as e:
+                return e
+            except Exception as e:
+                logger.error(f"Error tracing transaction {tx_hash}: {str(e)}")
+                return GCPRPCError(f"Error tracing transaction {tx_hash}: {str(e)}")
+        
+        if not tx_hashes:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tx_hashes))) as executor:
+            return list(executor.map(trace, tx_hashes))
+    
+    async def trace_transaction_async(self, tx_hash: str) -> Dict[str, Any]:
+        """
+        Async variant of trace_transaction.
+        
+        Args:
+            tx_hash: The transaction hash to trace
+            
+        Returns:
+            Detailed trace of the transaction execution
+        """
+        return await self._make_rpc_call_async("trace_transaction", [tx_hash])
+    
+    async def debug_trace_transaction_async(self, 
+                                            tx_hash: str, 
+                                            tracer: str = "callTracer") -> Dict[str, Any]:
+        """
+        Async variant of debug_trace_transaction.
+        
+        Args:
+            tx_hash: The transaction hash to trace
+            tracer: The tracer to use (default: "callTracer")
+            
+        Returns:
+            Detailed debug trace of the transaction
+        """
+        return await self._make_rpc_call_async("debug_traceTransaction", [tx_hash, {"tracer": tracer}])
+    
+    async def trace_block_async(self, 
+                                block_number: Union[str, int], 
+                                per_transaction: bool = False, 
+                                tracer: str = "callTracer") -> List[Union[Dict[str, Any], GCPRPCError]]:
+        """
+        Async variant of trace_block.
+        
+        With per_transaction set, every transaction in the block is debug-traced
+        as its own concurrent request on the shared aiohttp session.
+        
+        Args:
+            block_number: Block number or "latest"
+            per_transaction: Debug-trace every transaction in the block instead
+            tracer: The tracer to use when per_transaction is set (default: "callTracer")
+            
+        Returns:
+            List of traces for all transactions in the block; with per_transaction
+            set, a trace that failed is returned as its GCPRPCError
+        """
+        if per_transaction:
+            w3 = await self.get_async_web3()
+            block = await w3.eth.get_block(block_number)
+            return await asyncio.gather(
+                *(self.debug_trace_transaction_async(Web3.to_hex(tx_hash), tracer)
+                  for tx_hash in block["transactions"]),
+                return_exceptions=True
+            )
+        
+        if isinstance(block_number, int):
+            block_number = hex(block_number)
+        return await self._make_rpc_call_async("trace_block", [block_number])
+    
     def execute_contract_function(self, 
                                  contract_address: str, 
                                  abi: List[Dict], 
                                  function_name: str, 
                                  *args, 
+                                 function_abi_only: bool = True, 
                                  **kwargs) -> Any:
         """
         Execute a read-only contract function.
@@ -199,13 +516,30 @@ class GCPIntegration:
             abi: The contract ABI
             function_name: The function name to call
             *args: Function arguments
+            function_abi_only: Build the contract from only the entries for
+                function_name, so web3 does not index the rest of the ABI
             **kwargs: Additional options
             
         Returns:
             The function result
         """
         try:
-            contract = self.web3.eth.contract(address=contract_address, abi=abi)
+            key = (contract_address, function_name if function_abi_only else None, id(abi))
+            cached = self._contracts.get(key)
+            if cached is not None and cached[0] is abi:
+                self._contracts.move_to_end(key)
+                contract = cached[1]
+            else:
+                contract_abi = abi
+                if function_abi_only:
+                    contract_abi = [
+                        entry for entry in abi
+                        if entry.get("type") == "function" and entry.get("name") == function_name
+                    ]
+                contract = self.web3.eth.contract(address=contract_address, abi=contract_abi)
+                self._contracts[key] = (abi, contract)
+                if len(self._contracts) > CONTRACT_CACHE_SIZE:
+                    self._contracts.popitem(last=False)
             function = getattr(contract.functions, function_name)
             result = function(*args).call(**kwargs)
             return result
@@ -227,22 +561,31 @@ class GCPIntegration:
         Returns:
             The RPC response result
         """
-        try:
-            payload = {
-                "jsonrpc": "2.0",
-                "method": method,
-                "params": params,
-                "id": int(time.time() * 1000)
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
+        return self._make_rpc_batch([(method, params)])[0]
+    
+    def _make_rpc_batch(self, 
+                        calls: List[Tuple[str, List[Any]]], 
+                        raise_on_error: bool = True) -> List[Any]:
+        """
+        Make several JSON-RPC calls to the GCP Blockchain RPC endpoint in one request.
+        
+        Args:
+            calls: (method, params) pairs
+            raise_on_error: Raise if any call fails; otherwise failed calls are
+                returned as GCPRPCError instances in their slot
             
-            response = requests.post(
+        Returns:
+            The RPC results, in the same order as the calls
+        """
+        if not calls:
+            return []
+        
+        ids = [next(self._id_counter) for _ in calls]
+        try:
+            response = self.session.post(
                 self.rpc_url,
-                headers=headers,
-                data=json.dumps(payload),
+                headers=self.RPC_HEADERS,
+                data=self._encode_rpc_batch(calls, ids),
                 timeout=self.timeout
             )
             
@@ -250,13 +593,10 @@ class GCPIntegration:
                 logger.error(f"RPC call failed with status {response.status_code}: {response.text}")
                 raise GCPRPCError(f"RPC call failed with status {response.status_code}")
             
-            result = response.json()
-            
-            if "error" in result:
-                logger.error(f"RPC error: {result['error']}")
-                raise GCPRPCError(f"RPC error: {result['error']}")
-            
-            return result.get("result")
+            return self._decode_rpc_batch(calls, ids, orjson.loads(response.content), raise_on_error)
+        
+        except GCPRPCError:
+            raise
         
         except requests.exceptions.Timeout:
             logger.error(f"RPC call timed out after {self.timeout}s")
@@ -269,4 +609,111 @@ class GCPIntegration:
         except Exception as e:
             logger.error(f"Error in RPC call: {str(e)}")
             raise GCPRPCError(f"Error in RPC call: {str(e)}")
-
+    
+    async def _make_rpc_call_async(self, method: str, params: List[Any]) -> Any:
+        """
+        Async variant of _make_rpc_call.
+        
+        Args:
+            method: The RPC method name
+            params: The parameters for the method
+            
+        Returns:
+            The RPC response result
+        """
+        return (await self._make_rpc_batch_async([(method, params)]))[0]
+    
+    async def _make_rpc_batch_async(self, 
+                                    calls: List[Tuple[str, List[Any]]], 
+                                    raise_on_error: bool = True) -> List[Any]:
+        """
+        Async variant of _make_rpc_batch, sent through the shared aiohttp session.
+        
+        Args:
+            calls: (method, params) pairs
+            raise_on_error: Raise if any call fails; otherwise failed calls are
+                returned as GCPRPCError instances in their slot
+            
+        Returns:
+            The RPC results, in the same order as the calls
+        """
+        if not calls:
+            return []
+        
+        ids = [next(self._id_counter) for _ in calls]
+        try:
+            async with get_session().post(
+                self.rpc_url,
+                headers=self.RPC_HEADERS,
+                data=self._encode_rpc_batch(calls, ids),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                body = await response.read()
+            
+            return self._decode_rpc_batch(calls, ids, orjson.loads(body), raise_on_error)
+        
+        except GCPRPCError:
+            raise
+        
+        except asyncio.TimeoutError:
+            logger.error(f"RPC call timed out after {self.timeout}s")
+            raise GCPRPCError(f"RPC call timed out after {self.timeout}s")
+        
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"RPC call failed with status {e.status}: {e.message}")
+            raise GCPRPCError(f"RPC call failed with status {e.status}")
+        
+        except aiohttp.ClientError as e:
+            logger.error(f"Request error in RPC call: {str(e)}")
+            raise GCPRPCError(f"Request error in RPC call: {str(e)}")
+        
+        except Exception as e:
+            logger.error(f"Error in RPC call: {str(e)}")
+            raise GCPRPCError(f"Error in RPC call: {str(e)}")
+    
+    @staticmethod
+    def _encode_rpc_batch(calls: List[Tuple[str, List[Any]]], ids: List[int]) -> bytes:
+        """Encode (method, params) pairs as a JSON-RPC batch with the given request ids."""
+        return orjson.dumps([
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            for (method, params), request_id in zip(calls, ids)
+        ])
+    
+    @staticmethod
+    def _decode_rpc_batch(calls: List[Tuple[str, List[Any]]], 
+                          ids: List[int], 
+                          responses: Any, 
+                          raise_on_error: bool) -> List[Any]:
+        """
+        Put the entries of a JSON-RPC batch response back in call order.
+        
+        Args:
+            calls: The (method, params) pairs the batch was built from
+            ids: The request id of each call
+            responses: The decoded response body
+            raise_on_error: Raise on the first failed call instead of returning
+                it as a GCPRPCError in its slot
+            
+        Returns:
+            The RPC results, in the same order as the calls
+        """
+        # A malformed batch is answered with a single error object
+        if isinstance(responses, dict):
+            logger.error(f"RPC error: {responses.get('error')}")
+            raise GCPRPCError(f"RPC error: {responses.get('error')}")
+        
+        index = {request_id: i for i, request_id in enumerate(ids)}
+        results: List[Any] = [None] * len(calls)
+        for entry in responses:
+            i = index[entry["id"]]
+            if "error" in entry:
+                method = calls[i][0]
+                logger.error(f"RPC error in {method}: {entry['error']}")
+                error = GCPRPCError(f"RPC error: {entry['error']}")
+                if raise_on_error:
+                    raise error
+                results[i] = error
+            else:
+                results[i] = entry.get("result")
+        
+        return results
@@ -1,18 +1,35 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any, List, Union
+from typing import Dict, Optional, Any, List, Tuple, Union
 from decimal import Decimal
 
+from pylot._dataclasses import slotted
+from pylot._units import from_atoms, to_atoms
 
-@dataclass
+
+# Keys Intent.from_dict accepts
+_INTENT_FIELDS = frozenset((
+    "intent_type", "source_chain", "source_token", "amount", "destination_chain",
+    "destination_token", "destination_address", "options",
+))
+
+
+@slotted
+@dataclass(frozen=True, eq=False, repr=False)
 class Intent:
     """
     Represents a user's transaction intent for PYUSD operations.
     
+    Intents compare by identity; nothing compares or prints them on the
+    serialization path, so the generated __eq__ and __repr__ are left out.
+    
     Attributes:
         intent_type: Type of intent (transfer, swap, bridge)
         source_chain: Source blockchain network
         source_token: Token to be used from source chain
-        amount: Amount of tokens to use in the transaction
+        amount_atoms: Amount of tokens to use in the transaction, in atoms
+            (10**-PYUSD_DECIMALS units); the amount property gives it in
+            whole tokens
         destination_chain: Target blockchain network (if different from source)
         destination_token: Target token to receive
         destination_address: Address to receive tokens
@@ -21,11 +38,28 @@ class Intent:
     intent_type: str  # "transfer", "swap", or "bridge"
     source_chain: str
     source_token: str
-    amount: Decimal
+    amount_atoms: int
     destination_chain: Optional[str] = None
     destination_token: Optional[str] = None
     destination_address: Optional[str] = None
     options: Dict[str, Any] = field(default_factory=dict)
+    # Serialized amount, computed once for to_dict
+    _amount_str: str = field(init=False)
+    
+    def __post_init__(self):
+        # Whole-token amounts go through IntentParser or from_dict, which
+        # convert them; anything but an int here is a caller mixing up units
+        if type(self.amount_atoms) is not int:
+            raise TypeError(
+                f"Intent amount_atoms must be an int number of atoms, "
+                f"got {type(self.amount_atoms).__name__}"
+            )
+        object.__setattr__(self, "_amount_str", str(from_atoms(self.amount_atoms)))
+    
+    @property
+    def amount(self) -> Decimal:
+        """Amount of tokens to use in the transaction, in whole tokens."""
+        return from_atoms(self.amount_atoms)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert intent to dictionary representation."""
@@ -33,7 +67,7 @@ class Intent:
             "intent_type": self.intent_type,
             "source_chain": self.source_chain,
             "source_token": self.source_token,
-            "amount": str(self.amount),  # Convert Decimal to string for serialization
+            "amount": self._amount_str,
             "destination_chain": self.destination_chain,
             "destination_token": self.destination_token,
             "destination_address": self.destination_address,
@@ -42,12 +76,103 @@ class Intent:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Intent':
-        """Create intent from dictionary representation."""
-        # Convert amount from string to Decimal
-        if "amount" in data and isinstance(data["amount"], str):
-            data = data.copy()  # Make a copy to avoid modifying the original
-            data["amount"] = Decimal(data["amount"])
-        return cls(**data)
+        """
+        Create intent from dictionary representation.
+        
+        Accepts the keys to_dict writes and fills the slots directly instead
+        of going through __init__. The "amount" key is in whole tokens and is
+        converted to amount_atoms; the type, chain and token strings are
+        interned.
+        """
+        if not _INTENT_FIELDS.issuperset(data):
+            unexpected = next(iter(data.keys() - _INTENT_FIELDS))
+            raise TypeError(f"Intent.from_dict() got an unexpected key '{unexpected}'")
+        try:
+            intent_type = data["intent_type"]
+            source_chain = data["source_chain"]
+            source_token = data["source_token"]
+            amount = data["amount"]
+        except KeyError as e:
+            raise TypeError(f"Intent.from_dict() missing required key {e}") from None
+        return cls._from_parsed(
+            _intern(intent_type),
+            _intern(source_chain),
+            _intern(source_token),
+            to_atoms(amount),
+            _intern(data.get("destination_chain")),
+            _intern(data.get("destination_token")),
+            data.get("destination_address"),
+            data["options"] if "options" in data else {}
+        )
+    
+    @classmethod
+    def _from_parsed(cls,
+                     intent_type: str,
+                     source_chain: str,
+                     source_token: str,
+                     amount_atoms: int,
+                     destination_chain: Optional[str],
+                     destination_token: Optional[str],
+                     destination_address: Optional[str],
+                     options: Dict[str, Any]) -> 'Intent':
+        """
+        Create an intent from already converted field values.
+        
+        Fills the slots directly, skipping __init__ and its keyword argument
+        handling; the caller passes the amount in atoms and interns strings.
+        """
+        intent = object.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(intent, "intent_type", intent_type)
+        set_slot(intent, "source_chain", source_chain)
+        set_slot(intent, "source_token", source_token)
+        set_slot(intent, "amount_atoms", amount_atoms)
+        set_slot(intent, "destination_chain", destination_chain)
+        set_slot(intent, "destination_token", destination_token)
+        set_slot(intent, "destination_address", destination_address)
+        set_slot(intent, "options", options)
+        set_slot(intent, "_amount_str", str(from_atoms(amount_atoms)))
+        return intent
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a chain name or token, so equal values parsed from different
+    intents are the same object and compare by identity.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+# Arguments parse_from_dict passes to each intent type's parse method, as
+# (parameter, dictionary key, default when the key is missing)
+_PARSE_FIELDS: Dict[str, Tuple[Tuple[str, str, Any], ...]] = {
+    "transfer": (
+        ("source_chain", "source_chain", None),
+        ("amount", "amount", None),
+        ("destination_address", "destination_address", None),
+        ("token", "source_token", "PYUSD"),
+        ("options", "options", None),
+    ),
+    "swap": (
+        ("source_chain", "source_chain", None),
+        ("source_token", "source_token", None),
+        ("amount", "amount", None),
+        ("destination_token", "destination_token", None),
+        ("destination_address", "destination_address", None),
+        ("options", "options", None),
+    ),
+    "bridge": (
+        ("source_chain", "source_chain", None),
+        ("destination_chain", "destination_chain", None),
+        ("amount", "amount", None),
+        ("destination_address", "destination_address", None),
+        ("source_token", "source_token", "PYUSD"),
+        ("destination_token", "destination_token", "PYUSD"),
+        ("options", "options", None),
+    ),
+}
 
 
 class IntentParser:
@@ -56,10 +181,18 @@ class IntentParser:
     Converts user inputs into structured Intent objects.
     """
     
+    def __init__(self):
+        # Parse method for each intent type accepted by parse_from_dict
+        self._dispatch = {
+            "transfer": self.parse_transfer_intent,
+            "swap": self.parse_swap_intent,
+            "bridge": self.parse_bridge_intent,
+        }
+    
     def parse_transfer_intent(
         self, 
         source_chain: str,
-        amount: Union[Decimal, str, float],
+        amount: Union[Decimal, str, float, int],
         destination_address: str,
         token: str = "PYUSD",
         options: Dict[str, Any] = None
@@ -69,7 +202,7 @@ class IntentParser:
         
         Args:
             source_chain: The blockchain where the transfer occurs
-            amount: Amount of tokens to transfer
+            amount: Amount of tokens to transfer, in whole tokens
             destination_address: Address to receive the tokens
             token: Token to transfer (default: PYUSD)
             options: Additional parameters like gas price preferences
@@ -77,13 +210,16 @@ class IntentParser:
         Returns:
             Intent object representing the transfer
         """
-        amount_decimal = Decimal(str(amount)) if not isinstance(amount, Decimal) else amount
+        amount_atoms = to_atoms(amount)
+        
+        source_chain = _intern(source_chain)
+        token = _intern(token)
         
         return Intent(
             intent_type="transfer",
             source_chain=source_chain,
             source_token=token,
-            amount=amount_decimal,
+            amount_atoms=amount_atoms,
             destination_chain=source_chain,  # Same chain for transfers
             destination_token=token,  # Same token for transfers
             destination_address=destination_address,
@@ -94,7 +230,7 @@ class IntentParser:
         self,
         source_chain: str,
         source_token: str,
-        amount: Union[Decimal, str, float],
+        amount: Union[Decimal, str, float, int],
         destination_token: str,
         destination_address: Optional[str] = None,
         options: Dict[str, Any] = None
@@ -105,7 +241,7 @@ class IntentParser:
         Args:
             source_chain: The blockchain where the swap occurs
             source_token: Token to swap from
-            amount: Amount of source tokens to swap
+            amount: Amount of source tokens to swap, in whole tokens
             destination_token: Token to swap to
             destination_address: Address to receive swapped tokens (if different from sender)
             options: Additional parameters like slippage tolerance, minimum output
@@ -113,15 +249,17 @@ class IntentParser:
         Returns:
             Intent object representing the swap
         """
-        amount_decimal = Decimal(str(amount)) if not isinstance(amount, Decimal) else amount
+        amount_atoms = to_atoms(amount)
+        
+        source_chain = _intern(source_chain)
         
         return Intent(
             intent_type="swap",
             source_chain=source_chain,
-            source_token=source_token,
-            amount=amount_decimal,
+            source_token=_intern(source_token),
+            amount_atoms=amount_atoms,
             destination_chain=source_chain,  # Same chain for swaps
-            destination_token=destination_token,
+            destination_token=_intern(destination_token),
             destination_address=destination_address,
             options=options or {}
         )
@@ -130,7 +268,7 @@ class IntentParser:
         self,
         source_chain: str,
         destination_chain: str,
-        amount: Union[Decimal, str, float],
+        amount: Union[Decimal, str, float, int],
         destination_address: str,
         source_token: str = "PYUSD",
         destination_token: str = "PYUSD",
@@ -142,7 +280,7 @@ class IntentParser:
         Args:
             source_chain: Source blockchain network
             destination_chain: Target blockchain network
-            amount: Amount of tokens to bridge
+            amount: Amount of tokens to bridge, in whole tokens
             destination_address: Address to receive tokens on the destination chain
             source_token: Token to bridge from (default: PYUSD)
             destination_token: Token to receive on destination chain (default: PYUSD)
@@ -151,15 +289,15 @@ class IntentParser:
         Returns:
             Intent object representing the bridge operation
         """
-        amount_decimal = Decimal(str(amount)) if not isinstance(amount, Decimal) else amount
+        amount_atoms = to_atoms(amount)
         
         return Intent(
             intent_type="bridge",
-            source_chain=source_chain,
-            source_token=source_token,
-            amount=amount_decimal,
-            destination_chain=destination_chain,
-            destination_token=destination_token,
+            source_chain=_intern(source_chain),
+            source_token=_intern(source_token),
+            amount_atoms=amount_atoms,
+            destination_chain=_intern(destination_chain),
+            destination_token=_intern(destination_token),
             destination_address=destination_address,
             options=options or {}
         )
@@ -175,34 +313,79 @@ class IntentParser:
             Intent object
         """
         intent_type = data.get("intent_type")
+        parse = self._dispatch.get(intent_type)
+        if parse is None:
+            raise ValueError(f"Unknown intent type: {intent_type}")
+        return parse(**{
+            param: data.get(key, default)
+            for param, key, default in _PARSE_FIELDS[intent_type]
+        })
+    
+    def parse_from_dict_batch(self, data_list: List[Dict[str, Any]]) -> List[Intent]:
+        """
+        Parse a list of intents from their dictionary representations.
+        
+        Produces the same intents as calling parse_from_dict on each entry,
+        but groups the entries by intent type first so each group is built
+        in one specialized loop.
         
-        if intent_type == "transfer":
-            return self.parse_transfer_intent(
-                source_chain=data.get("source_chain"),
-                amount=data.get("amount"),
-                destination_address=data.get("destination_address"),
-                token=data.get("source_token", "PYUSD"),
-                options=data.get("options", {})
+        Args:
+            data_list: Dictionaries with intent parameters
+            
+        Returns:
+            List of Intent objects, in the same order as data_list
+        """
+        by_type: Dict[Any, List[int]] = {}
+        for i, data in enumerate(data_list):
+            by_type.setdefault(data.get("intent_type"), []).append(i)
+        
+        unknown = by_type.keys() - {"transfer", "swap", "bridge"}
+        if unknown:
+            raise ValueError(f"Unknown intent type: {next(iter(unknown))}")
+        
+        intents: List[Optional[Intent]] = [None] * len(data_list)
+        from_parsed = Intent._from_parsed
+        
+        for i in by_type.get("transfer", ()):
+            data = data_list[i]
+            source_chain = _intern(data.get("source_chain"))
+            token = _intern(data.get("source_token", "PYUSD"))
+            intents[i] = from_parsed(
+                "transfer",
+                source_chain,
+                token,
+                to_atoms(data.get("amount")),
+                source_chain,
+                token,
+                data.get("destination_address"),
+                data.get("options") or {}
             )
-        elif intent_type == "swap":
-            return self.parse_swap_intent(
-                source_chain=data.get("source_chain"),
-                source_token=data.get("source_token"),
-                amount=data.get("amount"),
-                destination_token=data.get("destination_token"),
-                destination_address=data.get("destination_address"),
-                options=data.get("options", {})
+        
+        for i in by_type.get("swap", ()):
+            data = data_list[i]
+            source_chain = _intern(data.get("source_chain"))
+            intents[i] = from_parsed(
+                "swap",
+                source_chain,
+                _intern(data.get("source_token")),
+                to_atoms(data.get("amount")),
+                source_chain,
+                _intern(data.get("destination_token")),
+                data.get("destination_address"),
+                data.get("options") or {}
             )
-        elif intent_type == "bridge":
-            return self.parse_bridge_intent(
-                source_chain=data.get("source_chain"),
-                destination_chain=data.get("destination_chain"),
-                amount=data.get("amount"),
-                destination_address=data.get("destination_address"),
-                source_token=data.get("source_token", "PYUSD"),
-                destination_token=data.get("destination_token", "PYUSD"),
-                options=data.get("options", {})
+        
+        for i in by_type.get("bridge", ()):
+            data = data_list[i]
+            intents[i] = from_parsed(
+                "bridge",
+                _intern(data.get("source_chain")),
+                _intern(data.get("source_token", "PYUSD")),
+                to_atoms(data.get("amount")),
+                _intern(data.get("destination_chain")),
+                _intern(data.get("destination_token", "PYUSD")),
+                data.get("destination_address"),
+                data.get("options") or {}
             )
-        else:
-            raise ValueError(f"Unknown intent type: {intent_type}")
-
+        
+        return intents
@@ -5,21 +5,35 @@ This module contains classes for optimizing transaction routes across different
 chains, bridges, and DEXs when working with PYUSD.
 """
 
+import functools
+import itertools
+import uuid
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
-import time
+from json.encoder import encode_basestring_ascii as _json_str
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, TextIO, Tuple, Union
 from decimal import Decimal
 
+import numpy as np
+
+from pylot._dataclasses import slotted
+from pylot._units import BPS, PYUSD_DECIMALS, from_atoms
+
 # Define constants for different types of transaction components
-class RouteType(Enum):
-    DIRECT = "direct"  # Direct transfer on same chain
-    SWAP = "swap"      # DEX swap
-    BRIDGE = "bridge"  # Cross-chain bridge
-    COMPLEX = "complex"  # Multi-step route
+class RouteType(IntEnum):
+    DIRECT = 0  # Direct transfer on same chain
+    SWAP = 1    # DEX swap
+    BRIDGE = 2  # Cross-chain bridge
+    COMPLEX = 3  # Multi-step route
+    
+    @property
+    def label(self) -> str:
+        """External name of the route type, as serialized"""
+        return _ROUTE_TYPE_LABELS[self]
 
 
-class ChainId(Enum):
+class ChainId(IntEnum):
     """Common EVM chain IDs"""
     ETHEREUM = 1
     ARBITRUM = 42161
@@ -28,38 +42,181 @@ class ChainId(Enum):
     BASE = 8453
 
 
-class DexProtocol(Enum):
+# DEX and bridge protocols share one value space, so a protocol of either
+# kind indexes _PROTOCOL_LABELS and never compares equal to one of the other
+
+class DexProtocol(IntEnum):
     """Common DEX protocols"""
-    UNISWAP_V2 = "uniswap_v2"
-    UNISWAP_V3 = "uniswap_v3"
-    SUSHISWAP = "sushiswap"
-    CURVE = "curve"
-    BALANCER = "balancer"
-    ONEINCH = "1inch"
+    UNISWAP_V2 = 0
+    UNISWAP_V3 = 1
+    SUSHISWAP = 2
+    CURVE = 3
+    BALANCER = 4
+    ONEINCH = 5
+    
+    @property
+    def label(self) -> str:
+        """External name of the protocol, as serialized"""
+        return _PROTOCOL_LABELS[self]
 
 
-class BridgeProtocol(Enum):
+class BridgeProtocol(IntEnum):
     """Common bridge protocols"""
-    STARGATE = "stargate"
-    HOP = "hop"
-    LAYERZERO = "layerzero"
-    AXELAR = "axelar"
-    CONNEXT = "connext"
+    STARGATE = 6
+    HOP = 7
+    LAYERZERO = 8
+    AXELAR = 9
+    CONNEXT = 10
+    
+    @property
+    def label(self) -> str:
+        """External name of the protocol, as serialized"""
+        return _PROTOCOL_LABELS[self]
+
+
+# External names, indexed by enum value
+_ROUTE_TYPE_LABELS: Tuple[str, ...] = ("direct", "swap", "bridge", "complex")
+_PROTOCOL_LABELS: Tuple[str, ...] = (
+    "uniswap_v2", "uniswap_v3", "sushiswap", "curve", "balancer", "1inch",
+    "stargate", "hop", "layerzero", "axelar", "connext",
+)
+
+
+Protocol = Union[DexProtocol, BridgeProtocol]
+
+# Example estimates used when generating routes
+DEX_FEE_BPS = 30  # Output is reduced by the DEX fee
+BRIDGE_FEE_BPS = 30  # Output is reduced by the bridge fee
+TRANSFER_GAS_COST = Decimal('5')  # Gas costs in USD
+SWAP_GAS_COST = Decimal('15')
+BRIDGE_GAS_COST = Decimal('20')
+
+# Route ids are a per-process random tag plus a counter, so they are unique
+# across processes without reading the clock for every route
+_ROUTE_ID_TAG = uuid.uuid4().hex[:8]
+_route_counter = itertools.count()
+
+# Every (step type, protocol) pair a step can carry, packed into a small int
+# code so per-step rates can be looked up from flat arrays
+_STEP_KEYS = tuple(
+    (step_type, protocol)
+    for step_type in RouteType
+    for protocol in (None, *DexProtocol, *BridgeProtocol)
+)
+_STEP_CODES = {key: code for code, key in enumerate(_STEP_KEYS)}
+
+
+# Protocol fee charged on a step's input amount (approximation) in basis
+# points, keyed by (step type, protocol); a None protocol is the default for
+# the step type
+_FEE_BPS: Mapping[Tuple[RouteType, Optional[Protocol]], int] = MappingProxyType({
+    # Bridge fees typically range from 0.1% to 0.5%
+    (RouteType.BRIDGE, None): 30,  # 0.3% average
+    # DEX fees typically range from 0.05% to 0.3%
+    (RouteType.SWAP, None): 30,  # 0.3% for most DEXes
+    (RouteType.SWAP, DexProtocol.CURVE): 4,  # 0.04%
+})
+
+# Expected slippage on a swap step's input amount (approximation) in basis
+# points, keyed like _FEE_BPS
+_SLIPPAGE_BPS: Mapping[Tuple[RouteType, Optional[Protocol]], int] = MappingProxyType({
+    (RouteType.SWAP, None): 40,  # 0.4% for other DEXes
+    # Curve typically has lower slippage for stablecoins
+    (RouteType.SWAP, DexProtocol.CURVE): 10,  # 0.1%
+    # Uniswap V3 has concentrated liquidity
+    (RouteType.SWAP, DexProtocol.UNISWAP_V3): 20,  # 0.2%
+})
+
+
+def _rate(rates: Mapping[Tuple[RouteType, Optional[Protocol]], int],
+          step_type: RouteType,
+          protocol: Optional[Protocol]) -> int:
+    """Look up a step's rate, falling back to the step type's default and then zero."""
+    rate = rates.get((step_type, protocol))
+    if rate is None:
+        rate = rates.get((step_type, None), 0)
+    return rate
+
+
+def _after_fee(atoms: int, fee_bps: int) -> int:
+    """Amount left after a fee of fee_bps basis points, rounded down to an atom."""
+    return atoms * (BPS - fee_bps) // BPS
+
+
+# Per step code lookup tables
+_FEE_RATE = np.array([_rate(_FEE_BPS, *key) for key in _STEP_KEYS], dtype=np.int64)
+_SLIPPAGE_RATE = np.array([_rate(_SLIPPAGE_BPS, *key) for key in _STEP_KEYS], dtype=np.int64)
+
+# Atoms per USD, for adding PYUSD-denominated fees to USD gas costs
+_ATOMS_PER_USD = 10**PYUSD_DECIMALS
+
+# Largest total route amount, in atoms, whose products with any rate table
+# entry (and sums of those) still fit in int64
+_INT64_SAFE_ATOMS = np.iinfo(np.int64).max // max(int(_FEE_RATE.max()), int(_SLIPPAGE_RATE.max()), 1)
+_IS_SWAP = np.array([step_type == RouteType.SWAP for step_type, _ in _STEP_KEYS], dtype=bool)
 
 
-@dataclass
+def _cached_estimate(method):
+    """Memoize a Route estimate until the route's steps are replaced."""
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._estimates[name]
+        except KeyError:
+            value = self._estimates[name] = method(self)
+            return value
+    
+    return wrapper
+
+
+@slotted
+@dataclass(frozen=True)
 class RouteStep:
     """Represents a single step in a multi-step transaction route"""
     step_type: RouteType
     source_chain_id: ChainId
     destination_chain_id: ChainId
-    protocol: Union[DexProtocol, BridgeProtocol, None]
+    protocol: Optional[Protocol]
     token_in: str
     token_out: str
-    amount_in: Decimal
-    estimated_amount_out: Decimal
+    amount_in: int  # Atoms
+    estimated_amount_out: int  # Atoms
     estimated_gas_cost: Decimal
     estimated_execution_time: int  # in seconds
+    
+    def to_json(self, buf: TextIO) -> None:
+        """
+        Write the step as compact JSON, matching its entry in Route.to_dict.
+        
+        Args:
+            buf: Text buffer to write to
+        """
+        buf.write('{"step_type":"')
+        buf.write(self.step_type.label)
+        buf.write('","source_chain_id":')
+        buf.write(str(self.source_chain_id.value))
+        buf.write(',"destination_chain_id":')
+        buf.write(str(self.destination_chain_id.value))
+        if self.protocol is not None:
+            buf.write(',"protocol":"')
+            buf.write(self.protocol.label)
+            buf.write('","token_in":')
+        else:
+            buf.write(',"protocol":null,"token_in":')
+        buf.write(_json_str(self.token_in))
+        buf.write(',"token_out":')
+        buf.write(_json_str(self.token_out))
+        buf.write(',"amount_in":"')
+        buf.write(str(from_atoms(self.amount_in)))
+        buf.write('","estimated_amount_out":"')
+        buf.write(str(from_atoms(self.estimated_amount_out)))
+        buf.write('","estimated_gas_cost":"')
+        buf.write(str(self.estimated_gas_cost))
+        buf.write('","estimated_execution_time":')
+        buf.write(str(self.estimated_execution_time))
+        buf.write('}')
 
 
 class Route:
@@ -71,6 +228,11 @@ class Route:
     bridge operation.
     """
     
+    __slots__ = (
+        "source_chain_id", "destination_chain_id", "_steps", "_route_id", "_estimates",
+        "_amount_in", "_gas", "_exec", "_code"
+    )
+    
     def __init__(self, 
                  source_chain_id: ChainId,
                  destination_chain_id: ChainId,
@@ -78,6 +240,9 @@ class Route:
         """
         Initialize a new route.
         
+        The steps are not checked to form a path; routes built from steps
+        that did not come from this module should use from_untrusted.
+        
         Args:
             source_chain_id: The starting chain ID
             destination_chain_id: The final chain ID
@@ -86,10 +251,72 @@ class Route:
         self.source_chain_id = source_chain_id
         self.destination_chain_id = destination_chain_id
         self.steps = steps
-        self.route_id = f"{int(time.time())}_{source_chain_id.value}_{destination_chain_id.value}"
+        self._route_id: Optional[str] = None
+    
+    @classmethod
+    def from_untrusted(cls,
+                       source_chain_id: ChainId,
+                       destination_chain_id: ChainId,
+                       steps: List[RouteStep]) -> "Route":
+        """
+        Create a route from externally supplied steps, validating that they
+        form a path from the source to the destination chain.
         
-        # Validate steps form a valid path
-        self._validate_steps()
+        Args:
+            source_chain_id: The starting chain ID
+            destination_chain_id: The final chain ID
+            steps: List of RouteStep objects that make up this route
+            
+        Returns:
+            Route: The validated route
+            
+        Raises:
+            ValueError: If the steps do not form a path between the chains
+        """
+        route = cls(source_chain_id, destination_chain_id, steps)
+        route._validate_steps()
+        return route
+    
+    @property
+    def route_id(self) -> str:
+        """Unique route id, assigned on first access since most routes are never serialized."""
+        if self._route_id is None:
+            self._route_id = (
+                f"{_ROUTE_ID_TAG}{next(_route_counter):x}_"
+                f"{self.source_chain_id.value}_{self.destination_chain_id.value}"
+            )
+        return self._route_id
+    
+    @route_id.setter
+    def route_id(self, route_id: str) -> None:
+        self._route_id = route_id
+    
+    @property
+    def steps(self) -> Tuple[RouteStep, ...]:
+        """The route's steps, in execution order."""
+        return self._steps
+    
+    @steps.setter
+    def steps(self, steps: List[RouteStep]) -> None:
+        # Steps are stored as a tuple so they can only change through this
+        # setter, which keeps the step arrays and cached estimates in sync
+        self._steps = tuple(steps)
+        self._estimates: Dict[str, Union[float, int]] = {}
+        
+        # Step numerics as parallel arrays, so the estimates are vectorized
+        # reductions instead of per-step Decimal loops. Amounts stay in atoms.
+        steps = self._steps
+        count = len(steps)
+        # Use int64 when every product with a rate fits; larger amounts fall
+        # back to exact Python ints in an object array
+        amounts = [step.amount_in for step in steps]
+        dtype = np.int64 if sum(map(abs, amounts)) <= _INT64_SAFE_ATOMS else object
+        self._amount_in = np.array(amounts, dtype=dtype)
+        self._gas = np.fromiter((float(step.estimated_gas_cost) for step in steps), dtype=np.float64, count=count)
+        self._exec = np.fromiter((step.estimated_execution_time for step in steps), dtype=np.int64, count=count)
+        self._code = np.fromiter(
+            (_STEP_CODES[(step.step_type, step.protocol)] for step in steps), dtype=np.int16, count=count
+        )
     
     def _validate_steps(self):
         """Ensure steps form a valid path from source to destination"""
@@ -109,10 +336,12 @@ class Route:
             if self.steps[i].destination_chain_id != self.steps[i+1].source_chain_id:
                 raise ValueError(f"Step {i+1} doesn't connect to step {i+2}")
     
-    def estimate_total_gas_cost(self) -> Decimal:
+    @_cached_estimate
+    def estimate_total_gas_cost(self) -> float:
         """Calculate the total gas cost across all steps in USD value"""
-        return sum(step.estimated_gas_cost for step in self.steps)
+        return float(self._gas.sum())
     
+    @_cached_estimate
     def estimate_execution_time(self) -> int:
         """
         Estimate the total execution time in seconds.
@@ -120,66 +349,34 @@ class Route:
         For bridges, this includes the finality time of transactions on
         the source chain and the confirmation time on the destination chain.
         """
-        return sum(step.estimated_execution_time for step in self.steps)
+        return int(self._exec.sum())
     
-    def estimate_total_fees(self) -> Decimal:
+    @_cached_estimate
+    def estimate_total_fees(self) -> float:
         """
         Calculate the total fees including gas costs, bridge fees,
         and DEX trading fees.
         """
-        # Gas cost is the base fee
-        total_fee = self.estimate_total_gas_cost()
-        
-        # Add protocol fees for each step (approximation)
-        for step in self.steps:
-            if step.step_type == RouteType.BRIDGE:
-                # Bridge fees typically range from 0.1% to 0.5%
-                bridge_fee = step.amount_in * Decimal('0.003')  # 0.3% average
-                total_fee += bridge_fee
-            
-            elif step.step_type == RouteType.SWAP:
-                # DEX fees typically range from 0.05% to 0.3%
-                if step.protocol == DexProtocol.CURVE:
-                    dex_fee = step.amount_in * Decimal('0.0004')  # 0.04%
-                else:
-                    dex_fee = step.amount_in * Decimal('0.003')  # 0.3% for most DEXes
-                total_fee += dex_fee
-        
-        return total_fee
+        # Gas cost is the base fee, plus protocol fees for each step (approximation)
+        fee_atoms = (self._amount_in * _FEE_RATE[self._code] // BPS).sum()
+        return self.estimate_total_gas_cost() + int(fee_atoms) / _ATOMS_PER_USD
     
-    def estimate_slippage(self) -> Decimal:
+    @_cached_estimate
+    def estimate_slippage(self) -> float:
         """
         Estimate the expected slippage across all swap operations.
         
         Returns:
-            Decimal: The estimated slippage as a percentage
+            float: The estimated slippage as a percentage
         """
         # Basic implementation - in a real system this would calculate based on
         # liquidity data from each DEX
-        total_swap_amount = Decimal('0')
-        weighted_slippage = Decimal('0')
-        
-        for step in self.steps:
-            if step.step_type == RouteType.SWAP:
-                total_swap_amount += step.amount_in
-                
-                # Estimate slippage based on amount and protocol
-                if step.protocol == DexProtocol.CURVE:
-                    # Curve typically has lower slippage for stablecoins
-                    step_slippage = Decimal('0.001') * step.amount_in  # 0.1%
-                elif step.protocol == DexProtocol.UNISWAP_V3:
-                    # Uniswap V3 has concentrated liquidity
-                    step_slippage = Decimal('0.002') * step.amount_in  # 0.2%
-                else:
-                    # Other DEXes
-                    step_slippage = Decimal('0.004') * step.amount_in  # 0.4%
-                
-                weighted_slippage += step_slippage
-        
+        total_swap_amount = self._amount_in[_IS_SWAP[self._code]].sum()
         if total_swap_amount == 0:
-            return Decimal('0')
+            return 0.0
         
-        return (weighted_slippage / total_swap_amount) * 100  # Return as percentage
+        weighted_slippage = self._amount_in @ _SLIPPAGE_RATE[self._code]
+        return float(weighted_slippage / total_swap_amount / 100)  # Basis points to percentage
     
     def to_dict(self) -> Dict:
         """Convert route to dictionary representation for serialization"""
@@ -189,14 +386,14 @@ class Route:
             "destination_chain_id": self.destination_chain_id.value,
             "steps": [
                 {
-                    "step_type": step.step_type.value,
+                    "step_type": step.step_type.label,
                     "source_chain_id": step.source_chain_id.value,
                     "destination_chain_id": step.destination_chain_id.value,
-                    "protocol": step.protocol.value if step.protocol else None,
+                    "protocol": step.protocol.label if step.protocol is not None else None,
                     "token_in": step.token_in,
                     "token_out": step.token_out,
-                    "amount_in": str(step.amount_in),
-                    "estimated_amount_out": str(step.estimated_amount_out),
+                    "amount_in": str(from_atoms(step.amount_in)),
+                    "estimated_amount_out": str(from_atoms(step.estimated_amount_out)),
                     "estimated_gas_cost": str(step.estimated_gas_cost),
                     "estimated_execution_time": step.estimated_execution_time
                 }
@@ -207,6 +404,75 @@ class Route:
             "total_fees": str(self.estimate_total_fees()),
             "estimated_slippage": str(self.estimate_slippage())
         }
+    
+    def to_json(self, buf: TextIO) -> None:
+        """
+        Write the route as compact JSON without building the to_dict graph.
+        
+        The output is the same document as json.dumps(route.to_dict(),
+        separators=(",", ":")).
+        
+        Args:
+            buf: Text buffer to write to
+        """
+        buf.write('{"route_id":')
+        buf.write(_json_str(self.route_id))
+        buf.write(',"source_chain_id":')
+        buf.write(str(self.source_chain_id.value))
+        buf.write(',"destination_chain_id":')
+        buf.write(str(self.destination_chain_id.value))
+        buf.write(',"steps":[')
+        for i, step in enumerate(self.steps):
+            if i:
+                buf.write(',')
+            step.to_json(buf)
+        buf.write('],"total_gas_cost":"')
+        buf.write(str(self.estimate_total_gas_cost()))
+        buf.write('","total_execution_time":')
+        buf.write(str(self.estimate_execution_time()))
+        buf.write(',"total_fees":"')
+        buf.write(str(self.estimate_total_fees()))
+        buf.write('","estimated_slippage":"')
+        buf.write(str(self.estimate_slippage()))
+        buf.write('"}')
+
+
+def score_routes(routes: List[Route], criterion: str = "cost") -> np.ndarray:
+    """
+    Score routes for an optimization criterion in a single vectorized pass.
+    
+    The step arrays of all routes are concatenated and reduced per route with
+    np.add.reduceat over the route offsets, instead of evaluating each route's
+    estimate separately.
+    
+    Args:
+        routes: Routes to score; each has at least one step
+        criterion: "cost", "time" or "slippage"; anything else scores by cost
+        
+    Returns:
+        np.ndarray: One score per route, lower is better
+    """
+    offsets = np.zeros(len(routes), dtype=np.intp)
+    np.cumsum([len(route.steps) for route in routes[:-1]], out=offsets[1:])
+    
+    if criterion == "time":
+        return np.add.reduceat(np.concatenate([route._exec for route in routes]), offsets)
+    
+    amounts = np.concatenate([route._amount_in for route in routes])
+    codes = np.concatenate([route._code for route in routes])
+    
+    if criterion == "slippage":
+        # Routes with huge amounts make these object arrays of Python ints
+        swap_amounts = np.add.reduceat(amounts * _IS_SWAP[codes], offsets).astype(np.float64)
+        weighted = np.add.reduceat(amounts * _SLIPPAGE_RATE[codes], offsets).astype(np.float64)
+        scores = np.zeros(len(routes), dtype=np.float64)
+        np.divide(weighted, swap_amounts, out=scores, where=swap_amounts != 0)
+        return scores / 100
+    
+    # Default to optimizing for cost
+    gas = np.add.reduceat(np.concatenate([route._gas for route in routes]), offsets)
+    fee_atoms = np.add.reduceat(amounts * _FEE_RATE[codes] // BPS, offsets)
+    return gas + (fee_atoms / _ATOMS_PER_USD).astype(np.float64)
 
 
 class RoutingOptimizer:
@@ -228,6 +494,10 @@ class RoutingOptimizer:
         self.pyusd_addresses = pyusd_addresses
         self.dex_routers = self._initialize_dex_routers()
         self.bridge_routers = self._initialize_bridge_routers()
+        # Routers indexed by chain, so route generation walks the protocols a
+        # chain supports instead of probing the router dicts per protocol
+        self._dex_by_chain = self._index_by_chain(self.dex_routers, DexProtocol)
+        self._bridges_by_chain = self._index_by_chain(self.bridge_routers, BridgeProtocol)
         
     def _initialize_dex_routers(self) -> Dict[Tuple[ChainId, DexProtocol], str]:
         """Initialize DEX router contract addresses for each supported chain/protocol"""
@@ -250,12 +520,33 @@ class RoutingOptimizer:
             # Add other supported bridges and chains
         }
     
+    @staticmethod
+    def _index_by_chain(routers: Mapping[Tuple[ChainId, Protocol], str],
+                        protocols: type) -> Dict[ChainId, List[Tuple[Protocol, str]]]:
+        """
+        Group router addresses by chain.
+        
+        Args:
+            routers: Router addresses keyed by (chain, protocol)
+            protocols: The protocol enum, whose declaration order each chain's
+                list follows
+            
+        Returns:
+            Dict mapping each chain to its (protocol, router address) pairs
+        """
+        by_chain: Dict[ChainId, List[Tuple[Protocol, str]]] = {}
+        for protocol in protocols:
+            for (chain_id, router_protocol), address in routers.items():
+                if router_protocol is protocol:
+                    by_chain.setdefault(chain_id, []).append((protocol, address))
+        return by_chain
+    
     def find_optimal_routes(self, 
                            source_chain_id: ChainId,
                            destination_chain_id: ChainId,
                            token_in: str,
                            token_out: str,
-                           amount: Decimal,
+                           amount: int,
                            optimization_criteria: str = "cost") -> List[Route]:
         """
         Find optimal routes for a transaction based on the given criteria.
@@ -265,7 +556,7 @@ class RoutingOptimizer:
             destination_chain_id: The chain ID where the transaction should end
             token_in: The input token address or symbol
             token_out: The output token address or symbol
-            amount: The amount of input token
+            amount: The amount of input token, in atoms
             optimization_criteria: What to optimize for ("cost", "time", "slippage")
             
         Returns:
@@ -276,25 +567,19 @@ class RoutingOptimizer:
             source_chain_id, destination_chain_id, token_in, token_out, amount
         )
         
-        # Sort based on optimization criteria
-        if optimization_criteria == "cost":
-            possible_routes.sort(key=lambda route: route.estimate_total_fees())
-        elif optimization_criteria == "time":
-            possible_routes.sort(key=lambda route: route.estimate_execution_time())
-        elif optimization_criteria == "slippage":
-            possible_routes.sort(key=lambda route: route.estimate_slippage())
-        else:
-            # Default to optimizing for cost
-            possible_routes.sort(key=lambda route: route.estimate_total_fees())
+        if not possible_routes:
+            return possible_routes
         
-        return possible_routes
+        # Sort based on optimization criteria, scoring every route in one pass
+        order = np.argsort(score_routes(possible_routes, optimization_criteria), kind="stable")
+        return [possible_routes[i] for i in order]
     
     def _generate_routes(self,
                         source_chain_id: ChainId,
                         destination_chain_id: ChainId,
                         token_in: str,
                         token_out: str,
-                        amount: Decimal) -> List[Route]:
+                        amount: int) -> List[Route]:
         """
         Generate possible routes between chains for the given tokens and amount.
         
@@ -310,7 +595,7 @@ class RoutingOptimizer:
             destination_chain_id: The destination chain
             token_in: Input token address or symbol
             token_out: Output token address or symbol
-            amount: Amount of input token
+            amount: Amount of input token, in atoms
             
         Returns:
             List[Route]: List of possible routes
@@ -333,15 +618,65 @@ class RoutingOptimizer:
                     token_out=token_out,
                     amount_in=amount,
                     estimated_amount_out=amount,
-                    estimated_gas_cost=Decimal('5'),  # Example gas cost in USD
+                    estimated_gas_cost=TRANSFER_GAS_COST,
                     estimated_execution_time=15  # Seconds
                 )
                 routes.append(Route(source_chain_id, destination_chain_id, [step]))
             else:
-                # Need a swap on the same chain
-                for dex in [DexProtocol.UNISWAP_V3, DexProtocol.CURVE]:
-                    # Check if this DEX is supported on this chain
-                    if (source_chain_id, dex) in self.dex_routers:
-                        swap_step = RouteStep(
-                            step_type
-
+                # Need a swap on the same chain, through each DEX it supports
+                for dex, _ in self._dex_by_chain.get(source_chain_id, ()):
+                    swap_step = RouteStep(
+                        step_type=RouteType.SWAP,
+                        source_chain_id=source_chain_id,
+                        destination_chain_id=destination_chain_id,
+                        protocol=dex,
+                        token_in=token_in,
+                        token_out=token_out,
+                        amount_in=amount,
+                        estimated_amount_out=_after_fee(amount, DEX_FEE_BPS),
+                        estimated_gas_cost=SWAP_GAS_COST,
+                        estimated_execution_time=15  # Seconds
+                    )
+                    routes.append(Route(source_chain_id, destination_chain_id, [swap_step]))
+        
+        # Case 2: Different chains, bridge (swapping into the output token first if needed)
+        else:
+            source_dexes = self._dex_by_chain.get(source_chain_id)
+            if token_in != token_out and not source_dexes:
+                return routes
+            
+            # Each bridge supported on the source chain
+            for bridge, _ in self._bridges_by_chain.get(source_chain_id, ()):
+                steps = []
+                bridge_amount = amount
+                if token_in != token_out:
+                    dex = source_dexes[0][0]
+                    bridge_amount = _after_fee(amount, DEX_FEE_BPS)
+                    steps.append(RouteStep(
+                        step_type=RouteType.SWAP,
+                        source_chain_id=source_chain_id,
+                        destination_chain_id=source_chain_id,
+                        protocol=dex,
+                        token_in=token_in,
+                        token_out=token_out,
+                        amount_in=amount,
+                        estimated_amount_out=bridge_amount,
+                        estimated_gas_cost=SWAP_GAS_COST,
+                        estimated_execution_time=15
+                    ))
+                
+                steps.append(RouteStep(
+                    step_type=RouteType.BRIDGE,
+                    source_chain_id=source_chain_id,
+                    destination_chain_id=destination_chain_id,
+                    protocol=bridge,
+                    token_in=token_out,
+                    token_out=token_out,
+                    amount_in=bridge_amount,
+                    estimated_amount_out=_after_fee(bridge_amount, BRIDGE_FEE_BPS),
+                    estimated_gas_cost=BRIDGE_GAS_COST,
+                    estimated_execution_time=600  # Source finality plus destination confirmation
+                ))
+                routes.append(Route(source_chain_id, destination_chain_id, steps))
+        
+        return routes
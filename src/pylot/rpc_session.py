@@ -0,0 +1,90 @@
+"""
+Shared HTTP transport for JSON-RPC traffic.
+
+This module keeps a single pooled aiohttp session so that every RPC provider
+reuses kept-alive connections instead of paying a TCP and TLS handshake for
+each request, and provides an async web3 provider that uses orjson for
+request and response (de)serialization.
+"""
+
+from typing import Any, Optional
+
+import aiohttp
+import orjson
+from eth_utils import to_hex
+from web3 import AsyncHTTPProvider
+from web3.datastructures import AttributeDict
+from web3.types import RPCEndpoint, RPCResponse
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _encode_default(obj: Any) -> Any:
+    """Encode the web3 types orjson does not serialize natively."""
+    if isinstance(obj, AttributeDict):
+        return dict(obj)
+    if isinstance(obj, bytes):
+        return to_hex(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    Async HTTP provider that encodes requests and decodes responses with orjson.
+
+    Trace and debug responses can be several megabytes, and decoding them is
+    much cheaper with orjson than with the stdlib json module.
+    """
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        return orjson.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or [],
+                "id": next(self.request_counter),
+            },
+            default=_encode_default
+        )
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared RPC session, creating it on first use.
+
+    Must be called from within a running event loop.
+
+    Returns:
+        The shared aiohttp ClientSession
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60, ttl_dns_cache=300),
+            raise_for_status=True
+        )
+    return _session
+
+
+async def use_shared_session(provider: AsyncHTTPProvider) -> None:
+    """
+    Route an async web3 provider's requests through the shared session.
+
+    Must be awaited before the provider makes its first request, otherwise
+    web3 will already have cached a session of its own for the endpoint.
+
+    Args:
+        provider: The provider to attach the shared session to
+    """
+    await provider.cache_async_session(get_session())
+
+
+async def close_session() -> None:
+    """Close the shared RPC session if it is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -6,44 +6,166 @@ Google BigQuery's public crypto datasets and real-time event tracking.
 """
 
 from google.cloud import bigquery
-from typing import Dict, List, Optional
+from google.cloud import bigquery_storage
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+
+PROJECT = 'bigquery-public-data'
+DATASET = 'crypto_ethereum'
+PYUSD_ADDRESS = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
+
+# Fully qualified table references, formatted once
+TOKEN_TRANSFERS_TABLE = f"`{PROJECT}.{DATASET}.token_transfers`"
+DEX_POOLS_TABLE = f"`{PROJECT}.{DATASET}.dex_pools`"
+TRANSACTIONS_TABLE = f"`{PROJECT}.{DATASET}.transactions`"
+STREAMING_TRANSFERS_TABLE = f"`{PROJECT}.{DATASET}.streaming_token_transfers`"
+
+# Query results are reused for RESULT_TTL seconds, keeping at most
+# RESULT_CACHE_SIZE of them. They are cached as immutable Arrow tables and
+# converted per call, so callers never share a mutable result
+RESULT_CACHE_SIZE = 32
+RESULT_TTL = 60
+
+# The token_transfers and transactions tables are partitioned by day on
+# block_timestamp, so windowed queries repeat the window as a
+# DATE(block_timestamp) predicate that lets BigQuery prune partitions
+
+
+def _job_config(days_back: Optional[int] = None) -> bigquery.QueryJobConfig:
+    """
+    Build the parameters for a PYUSD query.
+
+    Queries take the token address as @token_address and, when days_back is
+    given, the window start as @since. The window start is computed here and
+    rounded down to the hour instead of using CURRENT_TIMESTAMP() in SQL:
+    BigQuery never caches results of queries that call CURRENT_TIMESTAMP(),
+    while identical query text and parameters within the hour are served from
+    the query cache.
+    """
+    params = [bigquery.ScalarQueryParameter('token_address', 'STRING', PYUSD_ADDRESS)]
+    if days_back is not None:
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        params.append(bigquery.ScalarQueryParameter('since', 'TIMESTAMP', now - timedelta(days=days_back)))
+    return bigquery.QueryJobConfig(query_parameters=params, use_query_cache=True)
+
 
 class PYUSDAnalytics:
     def __init__(self):
         self.client = bigquery.Client()
-        self.project = 'bigquery-public-data'
-        self.dataset = 'crypto_ethereum'
+        # Results are downloaded as Arrow streams over the BigQuery Storage API
+        # instead of paged JSON from the REST API
+        self.bqstorage_client = bigquery_storage.BigQueryReadClient()
+        self.project = PROJECT
+        self.dataset = DATASET
+        # (method, args) -> (result, monotonic time the result was stored)
+        self._results: OrderedDict = OrderedDict()
+        # key -> task loading it, shared by callers that miss at the same time
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+
+    async def _cached(self, key: Hashable,
+                      load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the result stored under key if it is younger than RESULT_TTL,
+        otherwise await load() and store its result.
+        Concurrent callers that miss the cache wait on the same load.
+        """
+        entry = self._results.get(key)
+        if entry is not None:
+            result, stored_at = entry
+            if time.monotonic() - stored_at < RESULT_TTL:
+                self._results.move_to_end(key)
+                return result
+
+        pending = self._pending.get(key)
+        if pending is None:
+            async def load_and_store() -> Any:
+                result = await load()
+                self._results[key] = (result, time.monotonic())
+                self._results.move_to_end(key)
+                if len(self._results) > RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+                return result
+
+            pending = asyncio.create_task(load_and_store())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # Shield the shared load so one cancelled request does not cancel it for the others
+        return await asyncio.shield(pending)
+
+    # The query helpers block until the job finishes, so the async methods
+    # run them in worker threads to keep the event loop free
+
+    def _query_dataframe(self, query: str, days_back: Optional[int] = None) -> pd.DataFrame:
+        """
+        Run a query and download its result as a DataFrame
+        """
+        query_job = self.client.query(query, job_config=_job_config(days_back))
+        return query_job.to_dataframe(bqstorage_client=self.bqstorage_client)
+
+    def _query_arrow(self, query: str, days_back: Optional[int] = None) -> pa.Table:
+        """
+        Run a query and download its result as an Arrow table
+        """
+        query_job = self.client.query(query, job_config=_job_config(days_back))
+        return query_job.to_arrow(bqstorage_client=self.bqstorage_client)
+
+    @staticmethod
+    def _to_columns(table: pa.Table) -> Dict[str, np.ndarray]:
+        """
+        Convert an Arrow table to one NumPy array per column, straight from
+        Arrow without building a DataFrame. Arrays that share the table's
+        buffers are read-only, so the cached table cannot be modified
+        """
+        return {
+            name: table.column(name).to_numpy()
+            for name in table.schema.names
+        }
 
     async def get_pyusd_transfers(self, 
                                 days_back: int = 7) -> pd.DataFrame:
         """
         Query recent PYUSD transfers from BigQuery
         """
+        table = await self.get_pyusd_transfers_arrow(days_back)
+        return table.to_pandas()
+
+    async def get_pyusd_transfers_arrow(self, 
+                                      days_back: int = 7) -> pa.Table:
+        """
+        Query recent PYUSD transfers from BigQuery as an Arrow table,
+        for callers that do not need a DataFrame
+        """
         query = f"""
         SELECT
             block_timestamp,
             from_address,
             to_address,
             value / 1e6 as amount,
-            transaction_hash,
-            gas_price
-        FROM `{self.project}.{self.dataset}.token_transfers`
-        WHERE token_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
-        AND block_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {days_back} DAY)
+            transaction_hash
+        FROM {TOKEN_TRANSFERS_TABLE}
+        WHERE token_address = @token_address
+        AND DATE(block_timestamp) >= DATE(@since)
+        AND block_timestamp >= @since
         ORDER BY block_timestamp DESC
         """
         
-        query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        return await self._cached(
+            ('transfers', days_back),
+            lambda: asyncio.to_thread(self._query_arrow, query, days_back)
+        )
 
-    async def analyze_liquidity_pools(self) -> Dict:
+    async def analyze_liquidity_pools(self) -> Dict[str, np.ndarray]:
         """
         Analyze PYUSD liquidity pools on major DEXs
         """
-        query = """
+        query = f"""
         WITH pool_stats AS (
             SELECT
                 pool_address,
@@ -52,9 +174,9 @@ class PYUSDAnalytics:
                 reserve0 / power(10, token0_decimals) as token0_reserve,
                 reserve1 / power(10, token1_decimals) as token1_reserve,
                 block_timestamp
-            FROM `{self.project}.{self.dataset}.dex_pools`
-            WHERE token0_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
-            OR token1_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
+            FROM {DEX_POOLS_TABLE}
+            WHERE token0_address = @token_address
+            OR token1_address = @token_address
             ORDER BY block_timestamp DESC
             LIMIT 1000
         )
@@ -68,61 +190,90 @@ class PYUSDAnalytics:
         FROM pool_stats
         """
         
-        query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        table = await self._cached(
+            ('liquidity_pools',),
+            lambda: asyncio.to_thread(self._query_arrow, query)
+        )
+        return self._to_columns(table)
 
-    async def get_network_metrics(self) -> Dict:
+    async def get_network_metrics(self, days_back: int = 30) -> Dict[str, np.ndarray]:
         """
         Get network-wide metrics for PYUSD usage
         """
-        query = """
+        query = f"""
         SELECT
             DATE(block_timestamp) as date,
             COUNT(DISTINCT from_address) as unique_senders,
             COUNT(DISTINCT to_address) as unique_receivers,
             COUNT(*) as total_transfers,
             SUM(value / 1e6) as total_volume
-        FROM `{self.project}.{self.dataset}.token_transfers`
-        WHERE token_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
-        AND block_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
+        FROM {TOKEN_TRANSFERS_TABLE}
+        WHERE token_address = @token_address
+        AND DATE(block_timestamp) >= DATE(@since)
+        AND block_timestamp >= @since
         GROUP BY date
         ORDER BY date DESC
         """
         
-        query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        table = await self._cached(
+            ('network_metrics', days_back),
+            lambda: asyncio.to_thread(self._query_arrow, query, days_back)
+        )
+        return self._to_columns(table)
 
     async def track_realtime_events(self) -> None:
         """
         Track real-time PYUSD events using BigQuery's real-time features
         """
-        query = """
+        query = f"""
         SELECT *
-        FROM `{self.project}.{self.dataset}.streaming_token_transfers`
-        WHERE token_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
+        FROM {STREAMING_TRANSFERS_TABLE}
+        WHERE token_address = @token_address
         """
         
-        query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        return await asyncio.to_thread(self._query_dataframe, query)
 
-    async def analyze_gas_usage(self) -> pd.DataFrame:
+    async def analyze_gas_usage(self, days_back: int = 30) -> pd.DataFrame:
         """
         Analyze gas usage patterns for PYUSD transactions
         """
-        query = """
+        query = f"""
         SELECT
-            DATE(block_timestamp) as date,
-            AVG(gas_price) as avg_gas_price,
-            AVG(receipt_gas_used) as avg_gas_used,
+            DATE(t.block_timestamp) as date,
+            AVG(t.gas_price) as avg_gas_price,
+            AVG(t.receipt_gas_used) as avg_gas_used,
             COUNT(*) as num_transactions
-        FROM `{self.project}.{self.dataset}.transactions` t
-        JOIN `{self.project}.{self.dataset}.token_transfers` tt
+        FROM {TRANSACTIONS_TABLE} t
+        JOIN {TOKEN_TRANSFERS_TABLE} tt
         ON t.hash = tt.transaction_hash
-        WHERE tt.token_address = '0x6c3ea9036406c282D277Dc14762a4379D5084619'
-        AND block_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
+        WHERE tt.token_address = @token_address
+        AND DATE(t.block_timestamp) >= DATE(@since)
+        AND t.block_timestamp >= @since
+        AND DATE(tt.block_timestamp) >= DATE(@since)
+        AND tt.block_timestamp >= @since
         GROUP BY date
         ORDER BY date DESC
         """
         
-        query_job = self.client.query(query)
-        return query_job.to_dataframe()
+        table = await self._cached(
+            ('gas_usage', days_back),
+            lambda: asyncio.to_thread(self._query_arrow, query, days_back)
+        )
+        return table.to_pandas()
+
+    async def gather_all(self, days_back: int = 7) -> Dict[str, Any]:
+        """
+        Run the transfer, liquidity pool, network and gas queries concurrently
+        """
+        transfers, pools, metrics, gas = await asyncio.gather(
+            self.get_pyusd_transfers(days_back),
+            self.analyze_liquidity_pools(),
+            self.get_network_metrics(),
+            self.analyze_gas_usage()
+        )
+        return {
+            'transfers': transfers,
+            'liquidity_pools': pools,
+            'network_metrics': metrics,
+            'gas_usage': gas
+        }